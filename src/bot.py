@@ -1,6 +1,10 @@
 import os
 import sys
 import asyncio
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from concurrent.futures import ThreadPoolExecutor
 import datetime
 import random
 import time
@@ -16,6 +20,8 @@ from src.utils import EMOJIS, get_badge_emoji
 CHANNEL_ACCESS_CACHE_TTL_SECONDS = 300
 CHANNEL_ACCESS_CACHE_SWEEP_INTERVAL = 24 * 3600
 CHANNEL_ACCESS_INACTIVE_EVICT_SECONDS = 4 * 24 * 3600
+# Blocking Supabase/log calls are I/O bound; size the shared pool above asyncio's cpu+4 default
+DB_EXECUTOR_WORKERS = 16
 
 # Commands that should be restricted when guild channel setup is configured.
 GAMEPLAY_COMMANDS = {
@@ -31,6 +37,26 @@ ALWAYS_ALLOWED_COMMANDS = {
     "setup",
 }
 
+def _setup_queue_logging():
+    """
+    Route the `src.*` loggers through a QueueHandler so stderr writes happen
+    on the listener thread instead of the event loop. Returns the listener.
+    """
+    src_logger = logging.getLogger("src")
+    if any(isinstance(h, QueueHandler) for h in src_logger.handlers):
+        return None
+
+    log_queue = queue.SimpleQueue()
+    stream = logging.StreamHandler()
+    stream.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+    listener = QueueListener(log_queue, stream, respect_handler_level=True)
+
+    src_logger.addHandler(QueueHandler(log_queue))
+    src_logger.setLevel(logging.INFO)
+    src_logger.propagate = False
+    listener.start()
+    return listener
+
 # ========= BOT SETUP =========
 class WordleBot(commands.Bot):
     def __init__(self):
@@ -61,6 +87,10 @@ class WordleBot(commands.Bot):
         self._boot_notice_dispatched = False
         self.channel_access_cache = {}  # guild_id -> {'channels': set[int], 'configured': bool, 'loaded_at': float, 'last_access': float}
         self.channel_access_locks = {}  # guild_id -> asyncio.Lock
+        self.game_start_locks = {}  # channel_id -> asyncio.Lock for game check-and-register
+        self._start_lock_used = {}  # channel_id -> monotonic time of the last start_lock() call
+        self._log_listener = None
+        self.db_executor = ThreadPoolExecutor(max_workers=DB_EXECUTOR_WORKERS, thread_name_prefix="db")
 
     @staticmethod
     def _handle_task_exception(task):
@@ -78,6 +108,11 @@ class WordleBot(commands.Bot):
         task.add_done_callback(self._handle_task_exception)
         return task
 
+    def start_lock(self, channel_id):
+        """Per-channel lock for game check-and-register, stamped so the cleanup loop can prune idle ones."""
+        self._start_lock_used[channel_id] = time.monotonic()
+        return self.game_start_locks.setdefault(channel_id, asyncio.Lock())
+
     def _get_interaction_command_name(self, interaction: discord.Interaction) -> str:
         cmd = interaction.command
         cmd_name = getattr(cmd, "name", None)
@@ -175,6 +210,9 @@ class WordleBot(commands.Bot):
         return False
 
     async def setup_hook(self):
+        self._log_listener = _setup_queue_logging()
+        # asyncio.to_thread everywhere lands on the shared pool; asyncio.run shuts it down on exit
+        asyncio.get_running_loop().set_default_executor(self.db_executor)
         self.load_local_data()
         self.load_banned_users()
         self.setup_db()
@@ -218,6 +256,9 @@ class WordleBot(commands.Bot):
             await asyncio.gather(*self._background_tasks.values(), return_exceptions=True)
         self._background_tasks.clear()
         await super().close()
+        if self._log_listener:
+            self._log_listener.stop()
+            self._log_listener = None
 
     def load_local_data(self):
         """Load word lists from files."""
@@ -293,6 +334,11 @@ class WordleBot(commands.Bot):
         
         # Combined 5-letter set for general validation
         self.all_valid_5 = frozenset(temp_valid_set | temp_rush_wild_set)
+
+        # Word Rush pools: built once here so cog (re)loads share them instead of re-unioning
+        self.rush_secrets_pool = frozenset(self.secrets) | frozenset(self.hard_secrets)
+        self.rush_validation_5 = self.rush_secrets_pool | self.rush_wild_set
+        self.rush_combined_dict = self.rush_validation_5 | self.full_dict
         
         print(f"✅ Loaded word lists: {len(self.secrets)} simple, {len(self.hard_secrets)} classic secrets")
     
@@ -437,6 +483,17 @@ class WordleBot(commands.Bot):
                 
                 for cid in rush_remove:
                     self.constraint_mode.pop(cid, None)
+
+                # Prune start locks untouched for a whole interval. Locks are never dropped on
+                # game exit: a just-released lock can still have a waiter about to resume, and
+                # a fresh lock for the same channel would let both run check-and-register.
+                # Anyone holding or waiting on a lock called start_lock() far more recently.
+                idle_before = time.monotonic() - INTERVAL
+                for cid in [c for c, used in self._start_lock_used.items() if used < idle_before]:
+                    lock = self.game_start_locks.get(cid)
+                    if lock is None or not lock.locked():
+                        self.game_start_locks.pop(cid, None)
+                        del self._start_lock_used[cid]
                 
                 next_run = time.monotonic() + INTERVAL
             
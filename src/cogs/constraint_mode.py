@@ -1,4 +1,8 @@
 import asyncio
+import bisect
+import collections
+import heapq
+import logging
 import time
 import datetime
 import random
@@ -7,23 +11,55 @@ from discord.ext import commands
 from discord import app_commands
 from src.mechanics.constraint_logic import ConstraintGenerator
 from src.utils import EMOJIS, get_cached_username, calculate_level
-from src.database import fetch_user_profile_v2, get_daily_wr_gain, log_event_v1, update_user_stats_manual
+from src.database import fetch_user_profiles_batched, log_event_v1, log_events_bulk, update_user_stats_bulk, update_user_stats_manual
 from src.mechanics.rewards import get_tier_multiplier, apply_anti_grind
 from src.config import TIERS
 #from src.mechanics.streaks import StreakManager
 
+log = logging.getLogger(__name__)
+
 RUSH_TIME_SCALE = 1.20
+# Static round embed chrome
+BONUS_AUTHOR_NAME = "SPECIAL BONUS: 3x RUSH POINTS"
+BONUS_AUTHOR_ICON = "https://cdn.discordapp.com/emojis/1321033281982824479.png"
+FOOTER_GUESS = "Use `/g word:xxxxx`!"
+FOOTER_STOP = "`/stop_game` to end!"
+FOOTER_MULTI = "Type ALL possible words!"
+LOBBY_TIMEOUT_SECONDS = 300
+JOIN_COOLDOWN_SECONDS = 2.0
+SIGNAL_EDIT_MIN_PLAYERS = 3  # Smaller lobbies skip the mid-round yellow/red edits
+AGGREGATE_WINNER_FEEDBACK = True  # Podium summary rides on the round-end edit (no extra messages)
+USED_WORDS_CAP = 5000  # Oldest words become reusable past this many in one session
+RANKED_XP_SLOTS = 6  # Checkpoint ranks past this all earn the same base XP
+PUZZLE_TYPE_HISTORY = 10  # Recent puzzle types the variety check avoids
+BACKGROUND_DB_CONCURRENCY = 8  # Checkpoint write-backs in flight across all channels
+LOG_BACKLOG_LIMIT = 64  # Pending fire-and-forget log writes; extras are dropped
+# (rush points, feedback) for the first four correct guesses of a round; later ones get (1, "✓")
+_RUSH_RANK_TABLE = ((5, "🥇"), (4, "🥈"), (3, "🥉"), (2, "⭐"))
+# TIERS ascending by min_wr with a parallel threshold list for bisect lookups
+_TIERS_ASC = sorted(TIERS, key=lambda t: t['min_wr'])
+_TIER_THRESHOLDS = [t['min_wr'] for t in _TIERS_ASC]
 
 class ConstraintGame:
-    def __init__(self, bot, channel_id, started_by, generator, validation_base_5, combined_dict):
+    __slots__ = ('bot', 'channel_id', 'guild_id', 'started_by', 'round_number', 'scores', 'rounds_without_guess',
+                 'active_puzzle', 'used_words', 'used_words_order', 'winners_in_round', 'user_answers_this_round',
+                 'is_running', 'is_round_active', 'validation_base_5', 'combined_dict', 'generator',
+                 'round_task', 'game_msg', 'participants', 'participants_rendered', 'start_confirmed', 'total_wr_per_user',
+                 'profile_cache', 'name_cache', 'puzzle_types_used', 'rounds_since_last_bonus', 'is_bonus_round',
+                 'bonus_collected_words', 'streak_updated_users', 'fastest_answers', 'local_streaks',
+                 'best_local_streaks', 'round_start_time', 'lobby_start_time', 'last_edit_sig')
+
+    def __init__(self, bot, channel_id, started_by, generator, validation_base_5, combined_dict, guild_id=None):
         self.bot = bot
         self.channel_id = channel_id
+        self.guild_id = guild_id  # Resolved once; used in every RPC/log payload
         self.started_by = started_by
         self.round_number = 0
         self.scores = {}
         self.rounds_without_guess = 0
         self.active_puzzle = None
         self.used_words = set()
+        self.used_words_order = collections.deque(maxlen=USED_WORDS_CAP)
         self.winners_in_round = []
         self.user_answers_this_round = {}  # Track answers per user per round
         self.is_running = True
@@ -36,11 +72,15 @@ class ConstraintGame:
         self.round_task = None
         self.game_msg = None
         self.participants = {started_by.id}
+        self.participants_rendered = f"<@{started_by.id}>"  # Lobby mention list, appended on join
         self.start_confirmed = asyncio.Event()
         self.total_wr_per_user = {}
-        self.puzzle_types_used = set()  # Track which puzzle types have been used
+        self.profile_cache = {}  # {uid: profile}, fetched once, then advanced locally per checkpoint
+        self.name_cache = {}     # {uid: display_name}, resolved at most once per session
+        self.puzzle_types_used = collections.deque(maxlen=PUZZLE_TYPE_HISTORY)  # Sliding window of recent puzzle types
         self.rounds_since_last_bonus = 0
         self.is_bonus_round = False
+        self.bonus_collected_words = collections.defaultdict(list)  # {uid: [words]} for multi-word bonus rounds
         
         # Stats Tracking
         self.streak_updated_users = set()
@@ -49,6 +89,26 @@ class ConstraintGame:
         self.best_local_streaks = {} # {uid: max_session_streak}
         self.round_start_time = 0
         self.lobby_start_time = time.monotonic()
+        self.last_edit_sig = None  # Visible state of the last embed edit, to skip no-op PATCHes
+
+    def release(self):
+        """Unregister from bot.constraint_mode only if this game still owns the channel slot."""
+        if self.bot.constraint_mode.get(self.channel_id) is self:
+            self.bot.constraint_mode.pop(self.channel_id, None)
+
+    def add_participant(self, user_id):
+        """Add a lobby participant and extend the rendered mention list."""
+        if user_id in self.participants:
+            return
+        self.participants.add(user_id)
+        self.participants_rendered += f", <@{user_id}>"
+
+    def mark_word_used(self, word):
+        """Record a used word, evicting the oldest once USED_WORDS_CAP is reached."""
+        if len(self.used_words_order) == USED_WORDS_CAP:
+            self.used_words.discard(self.used_words_order[0])
+        self.used_words_order.append(word)
+        self.used_words.add(word)
 
     def add_score(self, user_id, wr_gain):
         if user_id not in self.scores:
@@ -58,25 +118,35 @@ class ConstraintGame:
 
 class RushStartView(discord.ui.View):
     def __init__(self, game):
-        super().__init__(timeout=300)
+        super().__init__(timeout=LOBBY_TIMEOUT_SECONDS)
         self.game = game
+        self._join_clicks = {}  # {uid: last_click_monotonic}
 
     async def update_lobby(self, interaction: discord.Interaction):
         embed = interaction.message.embeds[0]
         # Update Participants field
-        pts = [f"<@{uid}>" for uid in self.game.participants]
-        embed.set_field_at(0, name="Participants", value=", ".join(pts) if pts else "None yet", inline=False)
+        embed.set_field_at(0, name="Participants", value=self.game.participants_rendered or "None yet", inline=False)
         await interaction.response.edit_message(embed=embed, view=self)
 
     @discord.ui.button(label="Join Rush", style=discord.ButtonStyle.primary, emoji="⚡")
     async def join_button(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if interaction.user.id in self.game.participants:
+        uid = interaction.user.id
+        # Debounce spam clicks: ack silently without touching state or sending a message
+        now = time.monotonic()
+        if now - self._join_clicks.get(uid, 0) < JOIN_COOLDOWN_SECONDS:
+            return await interaction.response.defer()
+        self._join_clicks[uid] = now
+
+        if self.game.start_confirmed.is_set():
+            return await interaction.response.send_message("Rush already started.", ephemeral=True)
+
+        if uid in self.game.participants:
             return await interaction.response.send_message("You're already in the rush!", ephemeral=True)
         
         if len(self.game.participants) >= 10:
             return await interaction.response.send_message("⚠️ The lobby is full! (Max 10 players)", ephemeral=True)
 
-        self.game.participants.add(interaction.user.id)
+        self.game.add_participant(uid)
         await self.update_lobby(interaction)
 
     @discord.ui.button(label="Start Game", style=discord.ButtonStyle.success, emoji="▶️")
@@ -85,8 +155,8 @@ class RushStartView(discord.ui.View):
             return await interaction.response.send_message("Only the host can start the game.", ephemeral=True)
         
         self.game.start_confirmed.set()
-        await interaction.response.defer()
         self.stop()
+        await interaction.response.defer()
 
     @discord.ui.button(label="Dismiss", style=discord.ButtonStyle.danger)
     async def stop_button(self, interaction: discord.Interaction, button: discord.ui.Button):
@@ -94,23 +164,10 @@ class RushStartView(discord.ui.View):
             return await interaction.response.send_message("Only the host or an admin can dismiss.", ephemeral=True)
         
         self.game.is_running = False
-        self.game.bot.constraint_mode.pop(self.game.channel_id, None)
+        self.game.release()
         await interaction.response.edit_message(content="🛑 World Rush canceled.", embed=None, view=None)
         self.stop()
-    
-    async def on_timeout(self):
-        """Cleanup if lobby times out."""
-        if not self.game.start_confirmed.is_set():
-            # If game hasn't started, remove from bot dict
-            if self.game.channel_id in self.game.bot.constraint_mode:
-                self.game.bot.constraint_mode.pop(self.game.channel_id, None)
-            
-            # Try to update message
-            try:
-                if self.game.game_msg:
-                    await self.game.game_msg.edit(content="⏰ Rush lobby timed out.", view=None)
-            except (discord.HTTPException, discord.NotFound, AttributeError):
-                pass
+
 
 class ConstraintMode(commands.Cog):
     def __init__(self, bot):
@@ -123,27 +180,66 @@ class ConstraintMode(commands.Cog):
             'checkpoint': "https://cdn.discordapp.com/emojis/1458452466998706196.png",
             'bonus': "https://cdn.discordapp.com/emojis/1458455107631841402.png" 
         }
+
+        # Bound background DB/log fan-out so bursts can't saturate the shared executor
+        self._bg_sem = asyncio.Semaphore(BACKGROUND_DB_CONCURRENCY)
+        self._pending_logs = 0
+
+        # str.translate table: pattern char -> emoji block (letters use custom green emojis,
+        # '-' is an unknown slot). Upper and lower case map alike, so no per-char case folding.
+        self._visual_table = {}
+        for c in 'abcdefghijklmnopqrstuvwxyz':
+            block = EMOJIS.get(f"block_{c}_green", c.upper())
+            self._visual_table[ord(c)] = block
+            self._visual_table[ord(c.upper())] = block
+        self._visual_table[ord('-')] = EMOJIS.get('unknown', '⬜')
+
+        # Round embed templates: color/thumbnail/spacer (and bonus author) set once, copied per round
+        self._round_template_normal = discord.Embed(color=discord.Color.from_rgb(46, 204, 113))
+        self._round_template_normal.set_thumbnail(url=self.signal_urls['green'])
+        self._round_template_bonus = discord.Embed(color=discord.Color.from_rgb(255, 215, 0))
+        self._round_template_bonus.set_thumbnail(url=self.signal_urls['green'])
+        self._round_template_bonus.set_author(name=BONUS_AUTHOR_NAME, icon_url=BONUS_AUTHOR_ICON)
+        # Invisible spacer field locks round embed height (prevents morphing between edits)
+        for template in (self._round_template_normal, self._round_template_bonus):
+            template.add_field(name="\u200b", value="\u200b", inline=False)
         
-        # Initialize Shared Generator once
-        secrets_pool = set(bot.secrets) | set(bot.hard_secrets)
-        self.validation_base_5 = secrets_pool | bot.rush_wild_set
-        self.combined_dict = self.validation_base_5 | bot.full_dict
-        self.generator = ConstraintGenerator(secrets_pool, bot.full_dict, self.combined_dict)
+        # Word pools are frozensets prebuilt in bot.load_local_data; the shared generator
+        # (index build over the full dict) is deferred until the first /word_rush
+        self.validation_base_5 = bot.rush_validation_5
+        self.combined_dict = bot.rush_combined_dict
+        self.generator = None
+        self._generator_lock = asyncio.Lock()
+
+    async def _get_generator(self):
+        """Build the shared ConstraintGenerator on first use, off the event loop."""
+        if self.generator is None:
+            # Concurrent first callers wait for the one build instead of starting their own
+            async with self._generator_lock:
+                if self.generator is None:
+                    self.generator = await asyncio.to_thread(
+                        ConstraintGenerator, self.bot.rush_secrets_pool, self.bot.full_dict, self.combined_dict
+                    )
+        return self.generator
 
     @app_commands.command(name="word_rush", description="Fast-paced word hunt with linguistic constraints")
     @app_commands.guild_only()
     async def word_rush(self, interaction: discord.Interaction):
         cid = interaction.channel_id
-        if cid in self.bot.constraint_mode:
-            return await interaction.response.send_message("⚠️ A Word Rush session is already active in this channel.", ephemeral=True)
-        
-        if cid in self.bot.games or cid in self.bot.custom_games:
-             return await interaction.response.send_message("⚠️ A Wordle game is already active here. Finish it first!", ephemeral=True)
-        if cid in self.bot.race_sessions:
-            return await interaction.response.send_message("⚠️ A race session is already active here. Finish it first!", ephemeral=True)
-
-        game = ConstraintGame(self.bot, cid, interaction.user, self.generator, self.validation_base_5, self.combined_dict)
-        self.bot.constraint_mode[cid] = game
+        # Build (first use only) outside the lock so the check-and-register below has no await
+        generator = await self._get_generator()
+        # Channel lock shared with /wordle and /custom so no two game kinds register here at once
+        async with self.bot.start_lock(cid):
+            if cid in self.bot.constraint_mode:
+                return await interaction.response.send_message("⚠️ A Word Rush session is already active in this channel.", ephemeral=True)
+
+            if cid in self.bot.games or cid in self.bot.custom_games:
+                return await interaction.response.send_message("⚠️ A Wordle game is already active here. Finish it first!", ephemeral=True)
+            if cid in self.bot.race_sessions:
+                return await interaction.response.send_message("⚠️ A race session is already active here. Finish it first!", ephemeral=True)
+
+            game = ConstraintGame(self.bot, cid, interaction.user, generator, self.validation_base_5, self.combined_dict, guild_id=interaction.guild_id)
+            self.bot.constraint_mode[cid] = game
         
         embed = discord.Embed(
             title="⚡ Word Rush",
@@ -175,8 +271,7 @@ class ConstraintMode(commands.Cog):
         embed.set_footer(text=f"🎮 Hosted by {interaction.user.display_name}")
         
         # Add initial participant
-        pts = [f"<@{uid}>" for uid in game.participants]
-        embed.add_field(name="Participants", value=", ".join(pts) if pts else "None yet", inline=False)
+        embed.add_field(name="Participants", value=game.participants_rendered or "None yet", inline=False)
         
         view = RushStartView(game)
         await interaction.response.send_message(embed=embed, view=view)
@@ -184,7 +279,7 @@ class ConstraintMode(commands.Cog):
         game.game_msg = lobby_msg
 
         # Keep handle so /stop_game can cancel immediately.
-        game.round_task = self.bot.spawn_task(self.run_game_loop(interaction, game))
+        game.round_task = self.bot.spawn_task(self.run_game_loop(interaction, game, view))
 
     async def stop_rush_session(self, channel, requester=None):
         """
@@ -210,16 +305,15 @@ class ConstraintMode(commands.Cog):
 
         summary_embed = None
         if game.total_wr_per_user:
-            sorted_mvp = sorted(game.total_wr_per_user.items(), key=lambda x: x[1], reverse=True)
-            mvp_id, mvp_wr = sorted_mvp[0]
-            mvp_name = await get_cached_username(self.bot, mvp_id)
+            mvp_id, mvp_wr = max(game.total_wr_per_user.items(), key=lambda x: x[1])
+            mvp_name = await self._player_name(game, mvp_id)
             summary_embed = discord.Embed(
                 title="🏆 Rush Complete",
                 description=f"**Session MVP**\n{mvp_name} • {mvp_wr} Rush Points\n\nThanks for playing!",
                 color=discord.Color.gold()
             )
 
-        self.bot.constraint_mode.pop(cid, None)
+        game.release()
         return True, (summary_embed if summary_embed is not None else "🛑 Word Rush stopped.")
 
     def format_visual_pattern(self, visual):
@@ -227,23 +321,28 @@ class ConstraintMode(commands.Cog):
         if not visual:
             return ""
         
-        lines = visual.split('\n')
-        formatted_lines = []
-        
-        for line in lines:
-            formatted = ""
-            for char in line:
-                char_low = char.lower()
-                if char_low.isalpha():
-                    # Use custom emoji from EMOJIS dictionary
-                    formatted += EMOJIS.get(f"block_{char_low}_green", char.upper())
-                elif char == '-':
-                    formatted += EMOJIS.get('unknown', '⬜')
-                else:
-                    formatted += char
-            formatted_lines.append(formatted)
-        
-        return '\n'.join([f"{line}" for line in formatted_lines])
+        # Newlines and other unmapped chars pass through translate unchanged
+        return visual.translate(self._visual_table)
+
+    def _submit_log(self, func, *args):
+        """
+        Fire-and-forget a blocking log write on the executor.
+        Positional args go straight to run_in_executor: no coroutine, task, partial or context copy.
+        """
+        if self._pending_logs >= LOG_BACKLOG_LIMIT:
+            log.warning("Log backlog full (%s pending); dropping %s", self._pending_logs, func.__name__)
+            return
+        self._pending_logs += 1
+        fut = asyncio.get_running_loop().run_in_executor(self.bot.db_executor, func, *args)
+        fut.add_done_callback(self._log_done)
+
+    def _log_done(self, fut):
+        self._pending_logs -= 1
+        self.bot._handle_task_exception(fut)
+
+    async def _rpc_async(self, name, params):
+        """Run a Supabase RPC in a worker thread so the blocking client never stalls the loop."""
+        return await asyncio.to_thread(lambda: self.bot.supabase_client.rpc(name, params).execute())
 
     async def finalize_game_session(self, game, channel):
         """
@@ -262,37 +361,74 @@ class ConstraintMode(commands.Cog):
             # Identify users who actually played/scored
             # User requirement: "atleast some wr (rush points) earned"
             valid_participants = [uid for uid, wr in game.total_wr_per_user.items() if wr > 0]
-            
-            for uid in valid_participants:
-                try:
-                    is_victory = (game.round_number >= 100)
-                    
-                    self.bot.supabase_client.rpc('record_game_result_v4', {
-                        'p_user_id': uid,
-                        'p_guild_id': channel.guild.id if channel.guild else None,
-                        'p_mode': 'MULTI',
-                        'p_xp_gain': 0,     # Already awarded
-                        'p_wr_delta': 0,    # Already awarded
-                        'p_is_win': is_victory,
-                        'p_egg_trigger': None
-                    }).execute()
-                    
-                except Exception as e:
-                    print(f"Error finalizing stats for {uid}: {e}")
+            is_victory = (game.round_number >= 100)
+
+            # Sync supabase RPCs run off the event loop, all participants at once
+            results = await asyncio.gather(
+                *(self._rpc_async('record_game_result_v4', {
+                    'p_user_id': uid,
+                    'p_guild_id': game.guild_id,
+                    'p_mode': 'MULTI',
+                    'p_xp_gain': 0,     # Already awarded
+                    'p_wr_delta': 0,    # Already awarded
+                    'p_is_win': is_victory,
+                    'p_egg_trigger': None
+                }) for uid in valid_participants),
+                return_exceptions=True
+            )
+            for uid, res in zip(valid_participants, results):
+                if isinstance(res, Exception):
+                    log.error("Error finalizing stats for %s", uid, exc_info=res)
                     
-        except Exception as e:
-            print(f"Error in finalize_game_session: {e}")
+        except Exception:
+            log.exception("Error in finalize_game_session")
+
+    async def _player_name(self, game, uid):
+        """Session-scoped display name lookup on top of get_cached_username."""
+        name = game.name_cache.get(uid)
+        if name is None:
+            name = game.name_cache[uid] = await get_cached_username(self.bot, uid)
+        return name
+
+    async def _edit_if_changed(self, game, msg, embed):
+        """Edit msg with embed, skipping the request if nothing visible changed since the last edit."""
+        sig = (
+            msg.id,
+            embed.title,
+            embed.description,
+            embed.thumbnail.url,
+            embed.color.value if embed.color else None,
+            embed.footer.text,
+        )
+        if sig == game.last_edit_sig:
+            return
+        game.last_edit_sig = sig
+        await msg.edit(embed=embed)
+
+    def _fire_signal_edit(self, game, msg, embed):
+        """loop.call_at callback: spawn a traffic-light edit unless the session has ended."""
+        if game.is_running:
+            self.bot.spawn_task(self._edit_if_changed(game, msg, embed))
+
+    async def _rush_sleep(self, game, seconds):
+        """
+        Cancellation-aware sleep for the rush loop.
+        Returns False once the session has been stopped so callers skip further edits.
+        CancelledError is never swallowed here.
+        """
+        await asyncio.sleep(seconds)
+        return game.is_running
 
-    async def run_game_loop(self, interaction, game):
+    async def run_game_loop(self, interaction, game, view):
         try:
             channel = interaction.channel
             
-            try:
-                # 5 minute timeout matching the lobby view
-                await asyncio.wait_for(game.start_confirmed.wait(), timeout=300)
-            except asyncio.TimeoutError:
-                await channel.send("⏰ Rush cancelled: lobby timed out. (Manual start required)")
-                self.bot.constraint_mode.pop(game.channel_id, None)
+            # The lobby view alone decides: Start and Dismiss stop it, and an idle lobby
+            # (its timeout restarts on every click) auto-starts, the host always being in it
+            timed_out = await view.wait()
+            if timed_out and game.is_running:
+                game.start_confirmed.set()
+            if not game.start_confirmed.is_set():
                 return
             
             # Countdown sequence with consistent formatting
@@ -308,25 +444,29 @@ class ConstraintMode(commands.Cog):
             except (discord.HTTPException, discord.NotFound):
                 game.game_msg = await channel.send(embed=countdown_embed)
 
-            await asyncio.sleep(1.2)
+            if not await self._rush_sleep(game, 1.2):
+                return
             countdown_embed.set_thumbnail(url=self.signal_urls['yellow'])
             countdown_embed.description = "🟡 **GET SET!**\n\n\u200b\n\u200b\n\u200b"
             countdown_embed.color = discord.Color.gold()
-            await game.game_msg.edit(embed=countdown_embed)
+            await self._edit_if_changed(game, game.game_msg, countdown_embed)
             
-            await asyncio.sleep(1.2)
+            if not await self._rush_sleep(game, 1.2):
+                return
             countdown_embed.set_thumbnail(url=self.signal_urls['green'])
             countdown_embed.description = "🟢 **GO!**\n\n\u200b\n\u200b\n\u200b"
             countdown_embed.color = discord.Color.green()
-            await game.game_msg.edit(embed=countdown_embed)
+            await self._edit_if_changed(game, game.game_msg, countdown_embed)
             
-            await asyncio.sleep(1.5)
+            if not await self._rush_sleep(game, 1.5):
+                return
             
             countdown_embed.set_thumbnail(url=self.signal_urls['unlit'])
             countdown_embed.color = discord.Color.dark_gray()
-            await game.game_msg.edit(embed=countdown_embed)
+            await self._edit_if_changed(game, game.game_msg, countdown_embed)
             
-            await asyncio.sleep(0.5)
+            if not await self._rush_sleep(game, 0.5):
+                return
 
             # Main round loop
             while game.is_running:
@@ -338,7 +478,7 @@ class ConstraintMode(commands.Cog):
 
                 game.winners_in_round = []
                 game.user_answers_this_round = {}
-                game.bonus_collected_words = {}
+                game.bonus_collected_words = collections.defaultdict(list)
                 game.rounds_since_last_bonus += 1
                 
                 # Check if it's time for checkpoint
@@ -359,19 +499,19 @@ class ConstraintMode(commands.Cog):
                     game.rounds_since_last_bonus = 0
                 
                 # Ensure puzzle variety every 20 rounds
+                recent_types = set(game.puzzle_types_used)
                 force_unused_type = (game.round_number % 20 == 0 and 
-                                    len(game.puzzle_types_used) < 10)
+                                    len(recent_types) < PUZZLE_TYPE_HISTORY)
                 
                 game.active_puzzle = game.generator.generate_puzzle(
                     force_unused_type=force_unused_type,
-                    used_types=game.puzzle_types_used,
+                    used_types=recent_types,
                     is_bonus=game.is_bonus_round,
                     num_players=len(game.participants)
                 )
                 
-                game.puzzle_types_used.add(game.active_puzzle['type'])
-                if len(game.puzzle_types_used) >= 10:
-                    game.puzzle_types_used.clear()
+                # maxlen evicts the oldest type, so history never resets wholesale
+                game.puzzle_types_used.append(game.active_puzzle['type'])
                 
                 puzzle_desc = game.active_puzzle['description']
                 visual_raw = game.active_puzzle.get('visual', '')
@@ -381,64 +521,60 @@ class ConstraintMode(commands.Cog):
                 is_multi_word = game.active_puzzle.get('multi_word', False)
                 display_text = visual if visual else puzzle_desc
                 
-                # Constant spacing to prevent morphing
-                spacing = "\n\u200b" * 3
-                
-                spacing = "\n\u200b" * 4 # Extra spacing to lock height
-                
-                title = f"🎁 BONUS ROUND" if game.is_bonus_round else f"Round {game.round_number}"
-                round_embed = discord.Embed(
-                    title=title,
-                    description=f"{display_text}{spacing}",
-                    color=discord.Color.from_rgb(255, 215, 0) if game.is_bonus_round else discord.Color.from_rgb(46, 204, 113)
-                )
-                round_embed.set_thumbnail(url=self.signal_urls['green'])
-                
                 if game.is_bonus_round:
-                    round_embed.set_author(name="SPECIAL BONUS: 3x RUSH POINTS", icon_url="https://cdn.discordapp.com/emojis/1321033281982824479.png")
+                    round_embed = self._round_template_bonus.copy()
+                    round_embed.title = "🎁 BONUS ROUND"
                 else:
+                    round_embed = self._round_template_normal.copy()
+                    round_embed.title = f"Round {game.round_number}"
                     round_embed.set_author(name=f"Word Rush • Round {game.round_number} of 100")
+                round_embed.description = display_text
                 
                 # Rotating footer text
-                base_footer = "Use `/g word:xxxxx`" if game.round_number % 2 != 0 else "`/stop_game` to end"
-                
-                footer_text = f"{base_footer}!" if not is_multi_word else "Type ALL possible words!"
-                
+                if is_multi_word:
+                    footer_text = FOOTER_MULTI
+                else:
+                    footer_text = FOOTER_GUESS if game.round_number % 2 else FOOTER_STOP
                 round_embed.set_footer(text=footer_text)
+
+                # Prebuild the signal variants once; transitions edit with these unmodified
+                yellow_embed = round_embed.copy()
+                yellow_embed.set_thumbnail(url=self.signal_urls['yellow'])
+                yellow_embed.color = discord.Color.gold()
+                red_embed = round_embed.copy()
+                red_embed.set_thumbnail(url=self.signal_urls['red'])
+                red_embed.color = discord.Color.red()
                 
                 msg = await channel.send(embed=round_embed)
                 game.game_msg = msg
                 game.is_round_active = True
                 game.round_start_time = time.monotonic() # Start stats timer
                 
+                # Traffic-light timings (green, yellow, red) in unscaled seconds
+                if has_pattern or is_multi_word:
+                    green_s, yellow_s, red_s = 8, 7, 5
+                else:
+                    green_s, yellow_s, red_s = 5, 4, 3
+
+                show_signals = len(game.participants) >= SIGNAL_EDIT_MIN_PLAYERS
+
+                # Signal transitions are scheduled at absolute loop times and fired as tasks,
+                # so the round needs a single sleep and edits don't drift behind real time
+                signal_handles = []
+                if show_signals:
+                    loop = asyncio.get_running_loop()
+                    t0 = loop.time()
+                    for at, signal_embed in ((green_s, yellow_embed), (green_s + yellow_s, red_embed)):
+                        signal_handles.append(loop.call_at(
+                            t0 + at * RUSH_TIME_SCALE,
+                            self._fire_signal_edit, game, msg, signal_embed
+                        ))
                 try:
-                    if has_pattern or is_multi_word:
-                        await asyncio.sleep(8 * RUSH_TIME_SCALE)
-                        round_embed.set_thumbnail(url=self.signal_urls['yellow'])
-                        round_embed.color = discord.Color.gold()
-                        await msg.edit(embed=round_embed)
-                        
-                        await asyncio.sleep(7 * RUSH_TIME_SCALE)
-                        round_embed.set_thumbnail(url=self.signal_urls['red'])
-                        round_embed.color = discord.Color.red()
-                        await msg.edit(embed=round_embed)
-                        
-                        await asyncio.sleep(5 * RUSH_TIME_SCALE)
-                    else:
-                        await asyncio.sleep(5 * RUSH_TIME_SCALE)
-                        round_embed.set_thumbnail(url=self.signal_urls['yellow'])
-                        round_embed.color = discord.Color.gold()
-                        await msg.edit(embed=round_embed)
-                        
-                        await asyncio.sleep(4 * RUSH_TIME_SCALE)
-                        round_embed.set_thumbnail(url=self.signal_urls['red'])
-                        round_embed.color = discord.Color.red()
-                        await msg.edit(embed=round_embed)
-                        
-                        await asyncio.sleep(3 * RUSH_TIME_SCALE)
-                    
-                except asyncio.CancelledError:
-                    break
+                    if not await self._rush_sleep(game, (green_s + yellow_s + red_s) * RUSH_TIME_SCALE):
+                        break
+                finally:
+                    for handle in signal_handles:
+                        handle.cancel()
                 
                 game.is_round_active = False
                 
@@ -451,17 +587,21 @@ class ConstraintMode(commands.Cog):
                     
                     if game.winners_in_round:
                         winners_count = len(game.winners_in_round)
-                        round_embed.set_footer(text=f"✓ {winners_count} correct guess{'es' if winners_count > 1 else ''}")
+                        footer = f"✓ {winners_count} correct guess{'es' if winners_count > 1 else ''}"
+                        if AGGREGATE_WINNER_FEEDBACK:
+                            podium = []
+                            for medal, w_id in zip(("🥇", "🥈", "🥉"), game.winners_in_round):
+                                podium.append(f"{medal} {await self._player_name(game, w_id)}")
+                            footer = f"{footer} • {'  '.join(podium)}"
+                        round_embed.set_footer(text=footer)
                     else:
                         round_embed.set_footer(text="✗ No correct guesses!")
                     
-                    await msg.edit(embed=round_embed)
+                    await self._edit_if_changed(game, msg, round_embed)
                 
                 # Update Local Streaks for non-winners
-                current_winners = set(game.winners_in_round)
-                for part_id in game.participants:
-                    if part_id not in current_winners:
-                        game.local_streaks[part_id] = 0
+                for part_id in game.participants.difference(game.winners_in_round):
+                    game.local_streaks[part_id] = 0
 
                 if not game.winners_in_round:
                     game.rounds_without_guess += 1
@@ -476,9 +616,9 @@ class ConstraintMode(commands.Cog):
                         color=discord.Color.gold()
                     )
                      if game.total_wr_per_user:
-                        sorted_mvp = sorted(game.total_wr_per_user.items(), key=lambda x: x[1], reverse=True)
-                        m_id, m_wr = sorted_mvp[0]
-                        m_name = await get_cached_username(self.bot, m_id)
+                        top5 = heapq.nlargest(5, game.total_wr_per_user.items(), key=lambda x: x[1])
+                        m_id, m_wr = top5[0]
+                        m_name = await self._player_name(game, m_id)
                         final_embed.set_thumbnail(url="https://cdn.discordapp.com/emojis/1456199435682975827.png") # Green signal
                         final_embed.add_field(
                             name="👑 Rush Champion",
@@ -486,10 +626,11 @@ class ConstraintMode(commands.Cog):
                             inline=False
                         )
                         # Add Ranks
-                        ranks_txt = ""
-                        for i, (rid, rpts) in enumerate(sorted_mvp[:5]):
-                            rname = await get_cached_username(self.bot, rid)
-                            ranks_txt += f"`#{i+1}` **{rname}** - {rpts} pts\n"
+                        rnames = await asyncio.gather(*(self._player_name(game, rid) for rid, _ in top5))
+                        ranks_txt = "".join(
+                            f"`#{i+1}` **{rname}** - {rpts} pts\n"
+                            for i, ((_, rpts), rname) in enumerate(zip(top5, rnames))
+                        )
                         final_embed.add_field(name="Leaderboard", value=ranks_txt, inline=False)
 
                      await channel.send(embed=final_embed)
@@ -505,22 +646,22 @@ class ConstraintMode(commands.Cog):
                     )
                     
                     if game.total_wr_per_user:
-                        sorted_mvp = sorted(game.total_wr_per_user.items(), key=lambda x: x[1], reverse=True)
-                        m_id, m_wr = sorted_mvp[0]
-                        m_name = await get_cached_username(self.bot, m_id)
+                        m_id, m_wr = max(game.total_wr_per_user.items(), key=lambda x: x[1])
+                        m_name = await self._player_name(game, m_id)
                         final_embed.add_field(
                             name="🏆 Session MVP",
                             value=f"**{m_name}**\n{m_wr} WR earned",
                             inline=False
                         )
                         
-                        # Log Game Completion
-                        log_event_v1(
-                            bot=self.bot,
-                            event_type="word_rush_complete",
-                            user_id=m_id,
-                            guild_id=channel.guild.id if channel.guild else None,
-                            metadata={
+                        # Log Game Completion (fire-and-forget)
+                        self._submit_log(
+                            log_event_v1,
+                            self.bot,
+                            "word_rush_complete",
+                            m_id,
+                            game.guild_id,
+                            {
                                 "round_reached": game.round_number,
                                 "mvp_id": m_id,
                                 "mvp_points": m_wr,
@@ -537,14 +678,16 @@ class ConstraintMode(commands.Cog):
                 # if game.round_number % 50 == 0:
                 #    game.used_words.clear()
                 
-                await asyncio.sleep(2)
+                if not await self._rush_sleep(game, 2):
+                    break
 
-        except Exception as e:
-            print(f"Error in Rush Loop: {e}")
-            import traceback
-            traceback.print_exc()
+        except asyncio.CancelledError:
+            # /stop_game cancels round_task; let the cancellation propagate.
+            raise
+        except Exception:
+            log.exception("Error in Rush Loop")
         finally:
-            self.bot.constraint_mode.pop(interaction.channel_id, None)
+            game.release()
 
     async def process_multi_word_results(self, channel, game, msg):
         """Process results for multi-word bonus rounds."""
@@ -561,21 +704,19 @@ class ConstraintMode(commands.Cog):
         puzzle_type = game.active_puzzle['type']
         
         if puzzle_type == 'longest_word':
-            # Find longest word
-            winner_id = None
-            longest_word = ""
-            for uid, words in game.bonus_collected_words.items():
-                for word in words:
-                    if len(word) > len(longest_word):
-                        longest_word = word
-                        winner_id = uid
+            # Find longest word (earliest submission wins ties)
+            winner_id, longest_word = max(
+                ((uid, word) for uid, words in game.bonus_collected_words.items() for word in words),
+                key=lambda t: len(t[1]),
+                default=(None, "")
+            )
             
             if winner_id:
                 game.winners_in_round.append(winner_id)
                 wr_gain = 5 * 3  # 3x bonus
                 game.add_score(winner_id, wr_gain)
                 
-                winner_name = await get_cached_username(self.bot, winner_id)
+                winner_name = await self._player_name(game, winner_id)
                 result_embed = discord.Embed(
                     title=f"🎁 BONUS Round {game.round_number} - Winner!",
                     description=f"🏆 **{winner_name}** wins with **{longest_word.upper()}** ({len(longest_word)} letters)!\n\n+{wr_gain} WR earned\n\n\u200b",
@@ -585,20 +726,19 @@ class ConstraintMode(commands.Cog):
         
         elif puzzle_type == 'most_words':
             # Find who submitted most unique words
-            winner_id = None
-            max_count = 0
-            for uid, words in game.bonus_collected_words.items():
-                if len(words) > max_count:
-                    max_count = len(words)
-                    winner_id = uid
+            winner_id, words_found = max(
+                game.bonus_collected_words.items(),
+                key=lambda kv: len(kv[1]),
+                default=(None, [])
+            )
+            max_count = len(words_found)
             
             if winner_id:
                 game.winners_in_round.append(winner_id)
                 wr_gain = 5 * 3  # 3x bonus
                 game.add_score(winner_id, wr_gain)
                 
-                winner_name = await get_cached_username(self.bot, winner_id)
-                words_found = game.bonus_collected_words[winner_id]
+                winner_name = await self._player_name(game, winner_id)
                 result_embed = discord.Embed(
                     title=f"🎁 BONUS Round {game.round_number} - Winner!",
                     description=f"🏆 **{winner_name}** wins with **{max_count} words**!\n\n{', '.join(w.upper() for w in words_found[:5])}{'...' if len(words_found) > 5 else ''}\n\n+{wr_gain} WR earned\n\n\u200b",
@@ -611,20 +751,30 @@ class ConstraintMode(commands.Cog):
         if not game.scores:
             return []
 
-        sorted_scores = sorted(game.scores.items(), key=lambda x: x[1]['wr'], reverse=True)
+        # Head ranks set base XP; the tail is sorted too since its lines and logged ranks are ordered
+        ranked = heapq.nlargest(RANKED_XP_SLOTS, game.scores.items(), key=lambda x: x[1]['wr'])
+        ranked_ids = {uid for uid, _ in ranked}
+        sorted_scores = ranked + sorted(
+            (kv for kv in game.scores.items() if kv[0] not in ranked_ids),
+            key=lambda x: x[1]['wr'], reverse=True
+        )
         lines = []
         medals = ["🥇", "🥈", "🥉"]
         
-        # OPTIMIZATION: Batch fetch all profiles in ONE DB call
-        all_uids = [uid for uid, _ in sorted_scores]
-        from src.database import fetch_user_profiles_batched
-        profiles_map = fetch_user_profiles_batched(self.bot, all_uids)
+        # OPTIMIZATION: Batch fetch all profiles in ONE DB call per checkpoint
+        missing_uids = [uid for uid, _ in sorted_scores if uid not in game.profile_cache]
+        if missing_uids:
+            game.profile_cache.update(await asyncio.get_running_loop().run_in_executor(
+                self.bot.db_executor, fetch_user_profiles_batched, self.bot, missing_uids
+            ))
+        profiles_map = game.profile_cache
         
         # Collect DB updates for background processing
         db_updates = []
+        events_batch = []
 
         for i, (uid, data) in enumerate(sorted_scores):
-            user_name = await get_cached_username(self.bot, uid)
+            user_name = await self._player_name(game, uid)
             rp_total = data['wr']
             
             # Store Total RP for MVP if not already accounted for
@@ -658,46 +808,53 @@ class ConstraintMode(commands.Cog):
             level_up_msg = ""
             tier_up_msg = ""
             
-            if calculate_level(new_xp) > calculate_level(old_xp):
-                level_up_msg = f" 🆙 **Lvl {calculate_level(new_xp)}**"
+            old_lvl = calculate_level(old_xp)
+            new_lvl = calculate_level(new_xp)
+            if new_lvl > old_lvl:
+                level_up_msg = f" 🆙 **Lvl {new_lvl}**"
             
-            old_tier = None
-            new_tier = None
-            for t in TIERS:
-                if old_tier is None and old_wr >= t['min_wr']: old_tier = t
-                if new_tier is None and new_wr >= t['min_wr']: new_tier = t
-            
-            if new_tier and old_tier and new_tier['min_wr'] > old_tier['min_wr']:
-                tier_up_msg = f" 🏆 **{new_tier['name']}!**"
+            # Index -1 means below the lowest tier
+            old_ti = bisect.bisect_right(_TIER_THRESHOLDS, old_wr) - 1
+            new_ti = bisect.bisect_right(_TIER_THRESHOLDS, new_wr) - 1
+            if old_ti >= 0 and new_ti > old_ti:
+                tier_up_msg = f" 🏆 **{_TIERS_ASC[new_ti]['name']}!**"
             
             # Queue DB update for background processing
             db_updates.append((uid, final_xp, final_wr))
+            # Carry the queued totals forward so the next checkpoint never reads pre-write values;
+            # a new dict, since fetched profiles are shared with the global profile cache
+            profiles_map[uid] = {'xp': new_xp, 'multi_wr': new_wr}
             
             medal = medals[i] if i < 3 else "▫️"
             lines.append(f"{medal} **{user_name}** • {rp_total} pts (+{final_wr} WR){level_up_msg}{tier_up_msg}")
 
-            # Log Checkpoint Event (fire-and-forget)
-            self.bot.spawn_task(asyncio.to_thread(
-                log_event_v1,
-                bot=self.bot,
-                event_type="word_rush_checkpoint",
-                user_id=uid,
-                guild_id=channel.guild.id if channel.guild else None,
-                metadata={
+            # Checkpoint events are collected and inserted in one batch after the loop
+            events_batch.append({
+                "event_type": "word_rush_checkpoint",
+                "user_id": uid,
+                "guild_id": game.guild_id,
+                "metadata": {
                     "round_number": game.round_number,
                     "rush_points": rp_total,
                     "wr_gain": final_wr,
                     "rank": i + 1
                 }
-            ))
+            })
+
+        # Log Checkpoint Events (fire-and-forget)
+        self._submit_log(log_events_bulk, self.bot, events_batch)
         
         # BACKGROUND: Process all DB updates asynchronously
         async def process_db_updates():
-            for uid, xp, wr in db_updates:
-                try:
-                    await asyncio.to_thread(update_user_stats_manual, self.bot, uid, xp, wr, 'MULTI')
-                except Exception as e:
-                    print(f"Failed to record rewards for {uid}: {e}")
+            loop = asyncio.get_running_loop()
+            db_executor = self.bot.db_executor
+            async with self._bg_sem:
+                unwritten = await loop.run_in_executor(db_executor, update_user_stats_bulk, self.bot, db_updates, 'MULTI')
+                # Retry only the rows the bulk write didn't land, so nobody is credited twice
+                for uid, xp, wr in unwritten:
+                    res = await loop.run_in_executor(db_executor, update_user_stats_manual, self.bot, uid, xp, wr, 'MULTI')
+                    if res is None:
+                        log.error("Failed to record rush rewards for %s (+%s XP, +%s WR)", uid, xp, wr)
         
         self.bot.spawn_task(process_db_updates())
 
@@ -739,16 +896,22 @@ class ConstraintMode(commands.Cog):
                 stats_text += f"🔥 **Best Streak:** {s_cnt} in a row\n"
         else:
             # Rankings / MVP for Multiplayer
+            f_uid = s_uid = None
             if game.fastest_answers:
                  f_uid, f_time = min(game.fastest_answers.items(), key=lambda x: x[1])
-                 f_name = await get_cached_username(self.bot, f_uid)
-                 stats_text += f"⚡ **Fastest Reflex:** {f_name} ({f_time:.2f}s)\n"
-            
             if game.best_local_streaks:
                  s_uid, s_cnt = max(game.best_local_streaks.items(), key=lambda x: x[1])
-                 if s_cnt >= 3:
-                     s_name = await get_cached_username(self.bot, s_uid)
-                     stats_text += f"🔥 **On Fire:** {s_name} ({s_cnt} in a row!)\n"
+                 if s_cnt < 3:
+                     s_uid = None
+
+            # Both MVP lookups may hit the Discord API; resolve them concurrently
+            mvp_ids = [uid for uid in (f_uid, s_uid) if uid is not None]
+            mvp_names = dict(zip(mvp_ids, await asyncio.gather(*(self._player_name(game, uid) for uid in mvp_ids))))
+
+            if f_uid is not None:
+                 stats_text += f"⚡ **Fastest Reflex:** {mvp_names[f_uid]} ({f_time:.2f}s)\n"
+            if s_uid is not None:
+                 stats_text += f"🔥 **On Fire:** {mvp_names[s_uid]} ({s_cnt} in a row!)\n"
         
         if stats_text:
             checkpoint_embed.add_field(name="📊 Quick Stats", value=stats_text, inline=False)
@@ -765,11 +928,10 @@ class ConstraintMode(commands.Cog):
         Process a Word Rush guess from slash/modal or message flow.
         Returns True when the channel is in Word Rush mode (even if guess rejected).
         """
-        cid = channel.id
-        if cid not in self.bot.constraint_mode:
+        game = self.bot.constraint_mode.get(channel.id)
+        if game is None:
             return False
 
-        game = self.bot.constraint_mode[cid]
         if not game.is_round_active or not game.active_puzzle:
             if interaction is not None:
                 if not interaction.response.is_done():
@@ -778,7 +940,12 @@ class ConstraintMode(commands.Cog):
                     await interaction.followup.send("⏳ No active Word Rush round right now.", ephemeral=True)
             return True
 
-        if author.id not in game.participants:
+        uid = author.id
+        participants = game.participants
+        used_words = game.used_words
+        answers = game.user_answers_this_round
+        winners = game.winners_in_round
+        if uid not in participants:
             if interaction is not None:
                 if not interaction.response.is_done():
                     await interaction.response.send_message("⚠️ Join the rush first before guessing.", ephemeral=True)
@@ -787,16 +954,9 @@ class ConstraintMode(commands.Cog):
             return True
 
         guess = (content or "").strip().lower()
-        if not guess.isalpha():
-            if interaction is not None:
-                if not interaction.response.is_done():
-                    await interaction.response.send_message("⚠️ Letters only for Word Rush guesses.", ephemeral=True)
-                else:
-                    await interaction.followup.send("⚠️ Letters only for Word Rush guesses.", ephemeral=True)
-            return True
-
         puzzle = game.active_puzzle
         is_five_letter_only = puzzle.get('five_letter_only', False)
+        # O(1) length check runs before the isalpha scan
         if is_five_letter_only and len(guess) != 5:
             if interaction is not None:
                 if not interaction.response.is_done():
@@ -805,6 +965,14 @@ class ConstraintMode(commands.Cog):
                     await interaction.followup.send("⚠️ This round requires a 5-letter word.", ephemeral=True)
             return True
 
+        if not guess.isalpha():
+            if interaction is not None:
+                if not interaction.response.is_done():
+                    await interaction.response.send_message("⚠️ Letters only for Word Rush guesses.", ephemeral=True)
+                else:
+                    await interaction.followup.send("⚠️ Letters only for Word Rush guesses.", ephemeral=True)
+            return True
+
         valid_dict = game.validation_base_5 if is_five_letter_only else game.combined_dict
         if guess not in valid_dict:
             if interaction is not None:
@@ -815,7 +983,7 @@ class ConstraintMode(commands.Cog):
             return True
 
         if puzzle.get('multi_word', False):
-            if guess not in puzzle['solutions'] or guess in game.used_words:
+            if guess not in puzzle['solutions'] or guess in used_words:
                 if interaction is not None:
                     if not interaction.response.is_done():
                         await interaction.response.send_message("⚠️ Invalid or already-used word for this bonus round.", ephemeral=True)
@@ -823,11 +991,8 @@ class ConstraintMode(commands.Cog):
                         await interaction.followup.send("⚠️ Invalid or already-used word for this bonus round.", ephemeral=True)
                 return True
 
-            game.used_words.add(guess)
-            game.participants.add(author.id)
-            if author.id not in game.bonus_collected_words:
-                game.bonus_collected_words[author.id] = []
-            game.bonus_collected_words[author.id].append(guess)
+            game.mark_word_used(guess)
+            game.bonus_collected_words[uid].append(guess)
 
             if interaction is not None:
                 msg = f"✅ Accepted: `{guess.upper()}`"
@@ -837,7 +1002,7 @@ class ConstraintMode(commands.Cog):
                     await interaction.followup.send(msg, ephemeral=True)
             return True
 
-        if guess in game.used_words:
+        if guess in used_words:
             if interaction is not None:
                 if not interaction.response.is_done():
                     await interaction.response.send_message("⚠️ Word already used this session.", ephemeral=True)
@@ -853,7 +1018,7 @@ class ConstraintMode(commands.Cog):
                     await interaction.followup.send("❌ Does not satisfy this round's constraint.", ephemeral=True)
             return True
 
-        if author.id in game.user_answers_this_round:
+        if uid in answers:
             if interaction is not None:
                 if not interaction.response.is_done():
                     await interaction.response.send_message("⏭️ You already answered this round.", ephemeral=True)
@@ -861,41 +1026,29 @@ class ConstraintMode(commands.Cog):
                     await interaction.followup.send("⏭️ You already answered this round.", ephemeral=True)
             return True
 
-        game.used_words.add(guess)
-        game.participants.add(author.id)
-        game.user_answers_this_round[author.id] = guess
+        game.mark_word_used(guess)
+        answers[uid] = guess
 
-        rank = len(game.winners_in_round) + 1
-        game.winners_in_round.append(author.id)
+        rank = len(winners) + 1
+        winners.append(uid)
 
         elapsed = time.monotonic() - game.round_start_time
-        if elapsed < game.fastest_answers.get(author.id, 9999):
-            game.fastest_answers[author.id] = elapsed
-
-        game.local_streaks[author.id] = game.local_streaks.get(author.id, 0) + 1
-        current_streak = game.local_streaks[author.id]
-        if current_streak > game.best_local_streaks.get(author.id, 0):
-            game.best_local_streaks[author.id] = current_streak
-
-        rush_points = 1
-        reaction = "✓"
-        if rank == 1:
-            rush_points = 5
-            reaction = "🥇"
-        elif rank == 2:
-            rush_points = 4
-            reaction = "🥈"
-        elif rank == 3:
-            rush_points = 3
-            reaction = "🥉"
-        elif rank == 4:
-            rush_points = 2
-            reaction = "⭐"
+        fastest = game.fastest_answers
+        if elapsed < fastest.get(uid, 9999.0):
+            fastest[uid] = elapsed
+
+        streaks = game.local_streaks
+        best_streaks = game.best_local_streaks
+        current_streak = streaks[uid] = streaks.get(uid, 0) + 1
+        if current_streak > best_streaks.get(uid, 0):
+            best_streaks[uid] = current_streak
+
+        rush_points, reaction = _RUSH_RANK_TABLE[rank - 1] if rank <= len(_RUSH_RANK_TABLE) else (1, "✓")
 
         if game.is_bonus_round:
             rush_points *= 3
 
-        game.add_score(author.id, rush_points)
+        game.add_score(uid, rush_points)
 
         if interaction is not None:
             msg = f"{reaction} Accepted: `{guess.upper()}` (+{rush_points} pts)"
@@ -917,7 +1070,7 @@ class ConstraintMode(commands.Cog):
         if game.game_msg and reaction.message.id == game.game_msg.id:
             if not game.start_confirmed.is_set():
                 if len(game.participants) < 10:
-                    game.participants.add(user.id)
+                    game.add_participant(user.id)
 
     @commands.Cog.listener()
     async def on_message(self, message):
@@ -926,8 +1079,10 @@ class ConstraintMode(commands.Cog):
             return
         if message.author.bot:
             return
-        cid = message.channel.id
-        if cid not in self.bot.constraint_mode:
+        # Plain chat is the common case: one dict probe plus attribute/set checks reject it
+        # before a process_rush_guess coroutine is even created
+        game = self.bot.constraint_mode.get(message.channel.id)
+        if game is None or not game.is_round_active or message.author.id not in game.participants:
             return
         
         handled = await self.process_rush_guess(
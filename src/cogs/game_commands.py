@@ -2,6 +2,9 @@
 Game commands cog: /wordle, /wordle_classic, /solo, /show_solo, /cancel_solo, /stop_game, /custom
 """
 import asyncio
+import heapq
+import logging
+import re
 import discord
 from discord.ext import commands
 from discord import ui
@@ -11,10 +14,139 @@ import time
 from src.game import WordleGame
 from src.database import fetch_user_profile_v2
 from src.utils import EMOJIS, format_attempt_footer
-from src.ui import SoloView, get_markdown_keypad_status
-from src.handlers.game_logic import start_multiplayer_game
+from src.ui import SoloView, get_game_keypad_status
+from src.handlers.game_logic import start_multiplayer_game, build_start_embed
 from src.guess_entry import GuessEntryView
 
+log = logging.getLogger(__name__)
+
+_WORD_RE = re.compile(r"[a-z]{5}")  # Custom answer/dictionary/start word: exactly five ASCII letters
+_YES_NO = frozenset(("yes", "no"))
+_PLAYER_MENTION_RE = re.compile(r"<@!?(\d+)>|(\d+)")  # player: entry as a mention or raw user ID
+_TITLE_MENTION_RE = re.compile(r"<[@#]&?(\d+)>")  # User/role/channel mentions stripped from title:
+STOPPED_GAME_TTL_SECONDS = 300  # How long a /stop_game'd channel stays in bot.stopped_games
+
+
+# ========= CUSTOM MODE EXTRA OPTIONS =========
+# Each `key:value` entry of the modal's extra options field is dispatched on its key.
+# Handlers fill the shared opts dict and raise _ExtraOptionError with a user-facing message.
+
+class _ExtraOptionError(ValueError):
+    pass
+
+
+def _default_extra_options():
+    return {
+        'custom_dict': set(),
+        'time_limit_mins': None,
+        'allowed_players': set(),
+        'allowed_player_names': set(),
+        'blind_mode': False,  # False, 'full', 'green'
+        'start_words': [],
+        'custom_only': False,
+        'custom_title': None,
+    }
+
+
+def _opt_dict(opts, val, word):
+    # Validate and collect in one pass; a bad word aborts the whole setup anyway
+    custom_dict = opts['custom_dict']
+    for w in val.split(','):
+        w = w.strip().lower()
+        if not w:
+            continue
+        if _WORD_RE.fullmatch(w) is None:
+            raise _ExtraOptionError(f"❌ Invalid dictionary word `{w}`. All dictionary words must be exactly 5 letters (alphabetic only)!")
+        custom_dict.add(w)
+
+
+def _opt_strict_dict(opts, val, word):
+    _opt_dict(opts, val, word)
+    opts['custom_only'] = True
+
+
+def _opt_time(opts, val, word):
+    try:
+        time_val = float(val)
+    except ValueError:
+        raise _ExtraOptionError("❌ Invalid time limit! Must be a number (e.g. 10 or 0.5).") from None
+    if time_val < 0.5 or time_val > 360:
+        raise _ExtraOptionError("❌ Time limit must be between 0.5 and 360 minutes!")
+    opts['time_limit_mins'] = time_val
+
+
+def _opt_player(opts, val, word):
+    entries = [e.strip() for e in val.split(',') if e.strip()]
+    if len(entries) > 20:
+        raise _ExtraOptionError("❌ Maximum 20 players allowed in a custom game.")
+
+    for entry in entries:
+        match = _PLAYER_MENTION_RE.fullmatch(entry)
+        if match:
+            opts['allowed_players'].add(int(match.group(1) or match.group(2)))
+        else:
+            # No member intent fallback: accept @name/name tokens and let users claim via Ready button.
+            normalized = entry.lstrip("@").strip().lower()
+            if not normalized:
+                raise _ExtraOptionError(f"❌ Invalid player `{entry}`. Use mentions, user IDs, or plain usernames.")
+            opts['allowed_player_names'].add(normalized)
+
+
+def _opt_blind(opts, val, word):
+    val_low = val.lower()
+    if val_low in ['yes', 'true', 'on', 'full', '1']:
+        opts['blind_mode'] = 'full'
+    elif val_low == 'green':
+        opts['blind_mode'] = 'green'
+
+
+def _opt_start(opts, val, word):
+    # Support multiple start words
+    words = [w.strip().lower() for w in val.split(',') if w.strip()]
+    for w in words:
+        if _WORD_RE.fullmatch(w) is None:
+            raise _ExtraOptionError(f"❌ Invalid starting word `{w}`. All starting words must be exactly 5 letters!")
+    if word in words:
+        raise _ExtraOptionError("❌ A starting word cannot be the answer!")
+    if len(words) > 10:
+        raise _ExtraOptionError("❌ Maximum 10 starting words allowed.")
+    opts['start_words'] = words
+
+
+def _opt_title(opts, val, word):
+    # Sanitize title: remove mentions, links, and keep it reasonable length
+    # Remove anything that looks like a mention <@...> or <#...> or <@&...>
+    clean_title = _TITLE_MENTION_RE.sub('', val).strip()
+    # Character limit
+    if len(clean_title) > 100:
+        clean_title = clean_title[:97] + "..."
+    if clean_title:
+        opts['custom_title'] = clean_title
+
+
+_EXTRA_OPTION_HANDLERS = {
+    'dict': _opt_dict,
+    'strict_dict': _opt_strict_dict,
+    'time': _opt_time,
+    'player': _opt_player,
+    'blind': _opt_blind,
+    'start': _opt_start,
+    'title': _opt_title,
+}
+
+
+def _channel_busy_message(bot, cid):
+    """Why a custom game can't start in this channel, or None if it's free."""
+    if cid in bot.custom_games:
+        return "⚠️ A custom game is already active in this channel! Use `/stop_game` to end it."
+    if cid in bot.games:
+        return "⚠️ A regular game is already active. Use `/stop_game` first."
+    if cid in bot.constraint_mode:
+        return "⚠️ A Word Rush session is already active here. Finish it first."
+    if cid in bot.race_sessions:
+        return "⚠️ A race session is already active here. Finish it first."
+    return None
+
 
 # ========= CUSTOM MODE MODAL =========
 class EnhancedCustomModal(ui.Modal, title="🧂 CUSTOM MODE Setup"):
@@ -73,20 +205,23 @@ class EnhancedCustomModal(ui.Modal, title="🧂 CUSTOM MODE Setup"):
         extra = self.extra_options.value.strip()
 
         # Validation
-        if not word or not word.isalpha() or len(word) != 5:
+        if _WORD_RE.fullmatch(word) is None:
             return await interaction.response.send_message(
                 "❌ Invalid input! Word must be exactly 5 letters (alphabetic only).",
                 ephemeral=True
             )
+
+        # Acknowledge before parsing and waiting on the channel lock; Discord allows 3s
+        await interaction.response.defer(ephemeral=True)
         
-        if reveal not in ["yes", "no"]:
-            return await interaction.response.send_message(
+        if reveal not in _YES_NO:
+            return await interaction.followup.send(
                 "❌ Reveal must be 'yes' or 'no'.",
                 ephemeral=True
             )
         
-        if keyboard not in ["yes", "no"]:
-            return await interaction.response.send_message(
+        if keyboard not in _YES_NO:
+            return await interaction.followup.send(
                 "❌ Keyboard option must be 'yes' or 'no'.",
                 ephemeral=True
             )
@@ -95,186 +230,81 @@ class EnhancedCustomModal(ui.Modal, title="🧂 CUSTOM MODE Setup"):
         try:
             tries = int(tries_str)
             if tries < 3 or tries > 10:
-                return await interaction.response.send_message(
+                return await interaction.followup.send(
                     "❌ Number of tries must be between 3 and 10.",
                     ephemeral=True
                 )
         except ValueError:
-            return await interaction.response.send_message(
+            return await interaction.followup.send(
                 "❌ Invalid number of tries! Must be a number between 3-10.",
                 ephemeral=True
             )
 
         # Parse extra options
-        custom_dict = set()
-        time_limit_mins = None
-        allowed_players = set()
-        allowed_player_names = set()
-        blind_mode = False # False, 'full', 'green'
-        start_words = []
-        custom_only = False
-        custom_title = None
-        
+        opts = _default_extra_options()
         if extra:
-            # More robust split to handle cases like spaces around pipes
-            parts = [p.strip() for p in extra.split('|') if p.strip()]
-            for part in parts:
-                if ':' not in part: continue
-                key, val = [i.strip() for i in part.split(':', 1)]
-                key = key.lower()
-                
-                if key in ['dict', 'strict_dict']:
-                    words = [w.strip().lower() for w in val.split(',') if w.strip()]
-                    if not all(len(w) == 5 and w.isalpha() for w in words):
-                        return await interaction.response.send_message(
-                            "❌ All dictionary words must be exactly 5 letters (alphabetic only)!",
-                            ephemeral=True
-                        )
-                    custom_dict.update(words)
-                    if key == 'strict_dict':
-                        custom_only = True
-                
-                elif key == 'time':
-                    try:
-                        time_val = float(val)
-                        if time_val < 0.5 or time_val > 360:
-                            return await interaction.response.send_message(
-                                "❌ Time limit must be between 0.5 and 360 minutes!",
-                                ephemeral=True
-                            )
-                        time_limit_mins = time_val
-                    except ValueError:
-                        return await interaction.response.send_message(
-                            "❌ Invalid time limit! Must be a number (e.g. 10 or 0.5).",
-                            ephemeral=True
-                        )
-                
-                elif key == 'player':
-                    entries = [e.strip() for e in val.split(',') if e.strip()]
-                    if len(entries) > 20:
-                        return await interaction.response.send_message(
-                            "❌ Maximum 20 players allowed in a custom game.",
-                            ephemeral=True
-                        )
-                    
-                    import re
-                    for entry in entries:
-                        match = re.search(r'^<@!?(\d+)>$|^(\d+)$', entry)
-                        if match:
-                            target_id = int(match.group(1) or match.group(2))
-                            allowed_players.add(target_id)
-                        else:
-                            # No member intent fallback: accept @name/name tokens and let users claim via Ready button.
-                            normalized = entry.lstrip("@").strip().lower()
-                            if not normalized:
-                                return await interaction.response.send_message(
-                                    f"❌ Invalid player `{entry}`. Use mentions, user IDs, or plain usernames.",
-                                    ephemeral=True
-                                )
-                            allowed_player_names.add(normalized)
-                
-                elif key == 'blind':
-                    val_low = val.lower()
-                    if val_low in ['yes', 'true', 'on', 'full', '1']:
-                        blind_mode = 'full'
-                    elif val_low == 'green':
-                        blind_mode = 'green'
-                
-                elif key == 'start':
-                    # Support multiple start words
-                    words = [w.strip().lower() for w in val.split(',') if w.strip()]
-                    if not all(len(w) == 5 and w.isalpha() for w in words):
-                        return await interaction.response.send_message(
-                            "❌ All starting words must be exactly 5 letters!",
-                            ephemeral=True
-                        )
-                    for sw in words:
-                        if sw == word:
-                            return await interaction.response.send_message(
-                                "❌ A starting word cannot be the answer!",
-                                ephemeral=True
-                            )
-                    if len(words) > 10:
-                        return await interaction.response.send_message(
-                            "❌ Maximum 10 starting words allowed.",
-                            ephemeral=True
-                        )
-                    start_words = words
-
-                elif key == 'title':
-                    # Sanitize title: remove mentions, links, and keep it reasonable length
-                    import re
-                    # Remove anything that looks like a mention <@...> or <#...> or <@&...>
-                    clean_title = re.sub(r'<[@#]&?(\d+)>', '', val).strip()
-                    # Character limit
-                    if len(clean_title) > 100:
-                        clean_title = clean_title[:97] + "..."
-                    if clean_title:
-                        custom_title = clean_title
+            try:
+                for part in extra.split('|'):
+                    key, sep, val = part.partition(':')
+                    handler = _EXTRA_OPTION_HANDLERS.get(key.strip().lower())
+                    if sep and handler:
+                        handler(opts, val.strip(), word)
+            except _ExtraOptionError as e:
+                return await interaction.followup.send(str(e), ephemeral=True)
+
+        custom_dict = opts['custom_dict']
+        time_limit_mins = opts['time_limit_mins']
+        allowed_players = opts['allowed_players']
+        allowed_player_names = opts['allowed_player_names']
+        blind_mode = opts['blind_mode']
+        start_words = opts['start_words']
+        custom_only = opts['custom_only']
+        custom_title = opts['custom_title']
 
         reveal_bool = reveal == "yes"
         show_keyboard = keyboard == "yes"
         
         # Check if we have too many dict words
         if len(custom_dict) > 1000: # Limit to 1000 for robustness
-             return await interaction.response.send_message(
+             return await interaction.followup.send(
                 "❌ Custom dictionary is too large! Maximum 1000 words.",
                 ephemeral=True
             )
 
         # Check if ANY game already exists in this channel
         cid = interaction.channel.id
-        if cid in self.bot.custom_games:
-            return await interaction.response.send_message(
-                "⚠️ A custom game is already active in this channel!",
-                ephemeral=True
-            )
-        
-        if cid in self.bot.games:
-            return await interaction.response.send_message(
-                "⚠️ A regular game is already active in this channel!",
-                ephemeral=True
-            )
-
-        # Convert frozenset to set if needed (all_valid_5 is frozenset in bot.py)
-        if isinstance(self.bot.all_valid_5, frozenset):
-             self.bot.all_valid_5 = set(self.bot.all_valid_5)
-             
-        self.bot.all_valid_5.add(word)
-        if custom_dict:
-            self.bot.all_valid_5.update(custom_dict)
-
-        # Create game
-        game = WordleGame(word, cid, self.user, 0)
-        game.max_attempts = tries
-        game.reveal_on_loss = reveal_bool
-        game.custom_dict = custom_dict if custom_dict else None
-        game.time_limit = time_limit_mins
-        game.allowed_players = allowed_players
-        game.allowed_player_names = allowed_player_names
-        game.show_keyboard = show_keyboard
-        game.blind_mode = blind_mode
-        game.custom_only = custom_only
-        game.title = custom_title
-        game.player_lock_confirmed = not bool(allowed_players or allowed_player_names)
-        game.ready_players = set()
+        # Channel lock shared with start_multiplayer_game so a regular and a custom
+        # game can't both pass the checks below
+        async with self.bot.start_lock(cid):
+            # Re-run /custom's check: anything may have started while the modal was open
+            busy = _channel_busy_message(self.bot, cid)
+            if busy:
+                return await interaction.followup.send(busy, ephemeral=True)
+
+            # Create game
+            game = WordleGame(word, cid, self.user, 0)
+            game.max_attempts = tries
+            game.reveal_on_loss = reveal_bool
+            game.custom_dict = custom_dict if custom_dict else None
+            game.time_limit = time_limit_mins
+            game.allowed_players = allowed_players
+            game.allowed_player_names = allowed_player_names
+            game.show_keyboard = show_keyboard
+            game.blind_mode = blind_mode
+            game.custom_only = custom_only
+            game.title = custom_title
+            game.player_lock_confirmed = not bool(allowed_players or allowed_player_names)
+            game.ready_players = set()
         
-        # Apply start words
-        for sw in start_words:
-            pat = game.evaluate_guess(sw)
-            game.history.append({'word': sw, 'pattern': pat, 'user': self.bot.user})
-            game.guessed_words.add(sw.upper()) # Note: guessed_words uses UPPER in process_turn usually? 
-                                             # Actually WordleGame.is_duplicate does word.upper() in self.guessed_words
-                                             # So we should add upper.
-
-        if start_words:
-            # Add to guessed words set to prevent repeats
-            # Note: WordleGame uses upper() for guessed_words set
+            # Apply start words
+            bot_user = self.bot.user
             for sw in start_words:
-                game.guessed_words.add(sw.upper())
+                pat = game.evaluate_guess(sw)
+                game.history.append({'word': sw, 'pattern': pat, 'user': bot_user})
+                game.guessed_words.add(sw.upper())  # is_duplicate() checks upper-cased words
 
-        self.bot.custom_games[cid] = game
-        self.bot.stopped_games.discard(cid)
+            # No await since the busy check, so the slot is still free
+            self.bot.custom_games[cid] = game
 
         # Launch timer if needed
         if time_limit_mins:
@@ -310,9 +340,6 @@ class EnhancedCustomModal(ui.Modal, title="🧂 CUSTOM MODE Setup"):
         if custom_title:
             setup_details.append(f"**Custom Title:** {custom_title}")
 
-        if not interaction.response.is_done():
-            await interaction.response.defer(ephemeral=True)
-
         await interaction.followup.send(
             "✅ Custom game set up!\n" + "\n".join(setup_details),
             ephemeral=True
@@ -320,10 +347,6 @@ class EnhancedCustomModal(ui.Modal, title="🧂 CUSTOM MODE Setup"):
 
         # Announce in channel
         embed_title = f"{custom_title} Started" if custom_title else "🧂 Custom Wordle Game Started"
-        embed = discord.Embed(
-            title=embed_title,
-            color=discord.Color.teal()
-        )
         desc_parts = [
             f"A custom wordle has been set up by **{self.user.display_name}**",
             f"**{tries} attempts** total"
@@ -341,8 +364,7 @@ class EnhancedCustomModal(ui.Modal, title="🧂 CUSTOM MODE Setup"):
             blind_tag = "Active 🙈" if blind_mode == 'full' else "Greens Only 🟢"
             desc_parts.append(f"**Blind Mode:** {blind_tag}")
         
-        embed.description = "\n".join(desc_parts)
-        embed.add_field(name="How to Play", value="`/guess word:xxxxx` or `/g word:xxxxx`", inline=False)
+        embed = build_start_embed(embed_title, discord.Color.teal(), "\n".join(desc_parts), footer=None)
 
         await interaction.channel.send(embed=embed, view=GuessEntryView(self.bot))
 
@@ -415,7 +437,8 @@ class CustomPlayerReadyView(ui.View):
             (interaction.user.display_name or "").strip().lower(),
             (getattr(interaction.user, "global_name", "") or "").strip().lower(),
         }
-        matched_name = next((n for n in self.required_names if n in name_candidates), None)
+        # Probe the pending-name set with the clicker's (at most three) names instead of scanning it
+        matched_name = next(iter(name_candidates & self.required_names), None)
 
         if not allowed_by_id and not matched_name:
             return await interaction.response.send_message(
@@ -445,6 +468,9 @@ class CustomPlayerReadyView(ui.View):
         if getattr(self.game, "player_lock_confirmed", False):
             return
         self.bot.custom_games.pop(self.game.channel_id, None)
+        game_cog = self.bot.get_cog("GameCommands")
+        if game_cog:
+            game_cog.cancel_custom_timer(self.game.channel_id)
         channel = self.bot.get_channel(self.game.channel_id)
         if channel:
             try:
@@ -457,62 +483,97 @@ class GameCommands(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self._custom_timers = {} # channel_id: Task
+        # One task expires bot.stopped_games entries from a heap instead of a sleeper per stop
+        self._stopped_expiry = []  # heap of (monotonic_expiry, channel_id)
+        self._stopped_expiry_wake = asyncio.Event()
+        self._stopped_expiry_task = None
+
+        # Static /custom intro, built once and copied per invocation
+        self._custom_embed = discord.Embed(
+            title="🧂 CUSTOM MODE",
+            color=discord.Color.teal(),
+            description="Set up a game in **this** chat with your own custom word"
+        )
+        self._custom_embed.add_field(
+            name="How it works?",
+            value="• Click **Set Up** button below and enter a 5-letter word\n"
+                  "• A wordle match would start, others can use `/guess` or `/g` to make a guess\n"
+                  "• This mode gives **no XP** or **WR** score\n\n"
+                  "*Tip: Use `/help custom` to see all extra options!*",
+            inline=False
+        )
+        self._custom_embed.set_footer(text="You'll be prompted to enter a word and choose if the answer reveals on loss")
+
+    async def cog_load(self):
+        self._stopped_expiry_task = self.bot.spawn_task(self._stopped_expiry_loop())
 
     def cog_unload(self):
         for task in self._custom_timers.values():
             task.cancel()
+        if self._stopped_expiry_task:
+            self._stopped_expiry_task.cancel()
+
+    async def _stopped_expiry_loop(self):
+        """Discard stopped channels as their TTL lapses. The TTL is fixed, so pushes never precede the head."""
+        heap = self._stopped_expiry
+        while True:
+            if not heap:
+                self._stopped_expiry_wake.clear()
+                await self._stopped_expiry_wake.wait()
+                continue
+            expires_at, ch_id = heap[0]
+            delay = expires_at - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+            heapq.heappop(heap)
+            self.bot.stopped_games.discard(ch_id)
+
+    def _schedule_stopped_clear(self, channel_id):
+        heapq.heappush(self._stopped_expiry, (time.monotonic() + STOPPED_GAME_TTL_SECONDS, channel_id))
+        self._stopped_expiry_wake.set()
 
     async def _run_custom_timer(self, channel_id, game):
-        """Monotonic timer for custom games with a time limit."""
+        """Monotonic timer for custom games with a time limit.
+
+        Sleeps once until the deadline; games that end early cancel it via cancel_custom_timer.
+        """
         try:
-            while channel_id in self.bot.custom_games:
-                # Safety check: verify game still exists and hasn't been removed
-                current_game = self.bot.custom_games.get(channel_id)
-                if current_game is None or current_game != game:
-                    break  # Game was removed or replaced
-                
-                now = time.monotonic()
-                remaining = game.monotonic_end_time - now
-                
-                if remaining <= 0:
-                    break
-                
-                if remaining > 60: sleep_time = 30
-                elif remaining > 10: sleep_time = 5
-                elif remaining > 2: sleep_time = 1
-                elif remaining > 0.05: sleep_time = 0.05
-                else: sleep_time = 0
-                
-                if sleep_time > 0:
-                    await asyncio.sleep(min(sleep_time, remaining))
-                else:
-                    break
-            
-            # Time's up - verify game still exists before cleanup
-            if channel_id in self.bot.custom_games:
-                current_game = self.bot.custom_games.get(channel_id)
-                if current_game == game:  # Only remove if it's the same game instance
-                    self.bot.custom_games.pop(channel_id, None)
-                    channel = self.bot.get_channel(channel_id)
-                    if channel:
-                        try:
-                            embed = discord.Embed(
-                                title="⏰ Time's Up!",
-                                color=discord.Color.dark_grey()
-                            )
-                            desc = "The custom game has timed out."
-                            if getattr(game, 'reveal_on_loss', True):
-                                desc += f"\nThe word was **{game.secret.upper()}**."
-                            embed.description = desc
-                            await channel.send(embed=embed)
-                        except Exception as e:
-                            print(f"⚠️ Error sending timeout message: {e}")
+            remaining = game.monotonic_end_time - time.monotonic()
+            if remaining > 0:
+                await asyncio.sleep(remaining)
+
+            # Time's up - only remove the game if it's the same game instance
+            if self.bot.custom_games.get(channel_id) is game:
+                self.bot.custom_games.pop(channel_id, None)
+                channel = self.bot.get_channel(channel_id)
+                if channel:
+                    try:
+                        desc = "The custom game has timed out."
+                        if getattr(game, 'reveal_on_loss', True):
+                            desc += f"\nThe word was **{game.secret.upper()}**."
+                        embed = discord.Embed(
+                            title="⏰ Time's Up!",
+                            color=discord.Color.dark_grey(),
+                            description=desc
+                        )
+                        await channel.send(embed=embed)
+                    except Exception:
+                        log.warning("Error sending custom timeout message in %s", channel_id, exc_info=True)
         except asyncio.CancelledError:
             pass
-        except Exception as e:
-            print(f"❌ Error in custom timer {channel_id}: {e}")
+        except Exception:
+            log.exception("Error in custom timer %s", channel_id)
         finally:
-            self._custom_timers.pop(channel_id, None)
+            # A replacement game may already have registered its own timer here
+            if self._custom_timers.get(channel_id) is asyncio.current_task():
+                del self._custom_timers[channel_id]
+
+    def cancel_custom_timer(self, channel_id):
+        """Stop a custom game's timer once the game has ended some other way."""
+        task = self._custom_timers.pop(channel_id, None)
+        if task:
+            task.cancel()
 
     async def start_custom_timer(self, channel_id, game):
         """Helper to launch the custom game timer task."""
@@ -547,15 +608,20 @@ class GameCommands(commands.Cog):
     async def solo(self, ctx):
         if not ctx.interaction: return
         await ctx.defer(ephemeral=True)
-        if ctx.author.id in self.bot.solo_games:
+        uid = ctx.author.id
+        # No await between this check and the insert below, so two /solo calls can't
+        # both pass it; keep it that way rather than adding a per-user lock
+        if uid in self.bot.solo_games:
             return await ctx.send("⚠️ You already have a solo game running!", ephemeral=True)
 
-        secret = __import__('random').choice(self.bot.secrets)
+        secret = random.choice(self.bot.secrets)
         game = WordleGame(secret, 0, ctx.author, 0)
-        self.bot.solo_games[ctx.author.id] = game
+        self.bot.solo_games[uid] = game
 
-        embed = discord.Embed(color=discord.Color.gold())
-        embed.description = "This game is **private**. Only you can see it.\nUse the button below to guess."
+        embed = discord.Embed(
+            color=discord.Color.gold(),
+            description="This game is **private**. Only you can see it.\nUse the button below to guess."
+        )
         embed.set_footer(text=format_attempt_footer(0, game.max_attempts))
 
         view = SoloView(self.bot, game, ctx.author)
@@ -563,25 +629,26 @@ class GameCommands(commands.Cog):
 
     @commands.hybrid_command(name="show_solo", description="Show your active solo game (if dismissed).")
     async def show_solo(self, ctx):
-        if ctx.author.id not in self.bot.solo_games:
+        uid = ctx.author.id
+        if uid not in self.bot.solo_games:
             return await ctx.send("⚠️ No active solo game found.", ephemeral=True)
 
-        game = self.bot.solo_games[ctx.author.id]
+        game = self.bot.solo_games[uid]
 
-        board_display = "\n".join([f"{h['pattern']}" for h in game.history]) if game.history else "No guesses yet."
-        keypad = get_markdown_keypad_status(game.used_letters, self.bot, ctx.author.id, blind_mode=getattr(game, 'blind_mode', False))
+        board_display = game.board_string() or "No guesses yet."
+        keypad = get_game_keypad_status(game, self.bot, uid, blind_mode=getattr(game, 'blind_mode', False))
 
-        embed = discord.Embed(color=discord.Color.gold())
-        embed.description = f"{board_display}\n\n{keypad}"
+        last_guess = (game.history[-1].get('word') or '').upper() if game.history else ''
+        desc = f"{board_display}\n\n{keypad}"
+        if last_guess:
+            desc = f"Guessed `{last_guess}`\n{desc}"
+        embed = discord.Embed(color=discord.Color.gold(), description=desc)
         embed.set_footer(text=format_attempt_footer(game.attempts_used, 6))
-        if game.history:
-            last_guess = (game.history[-1].get('word') or '').upper()
-            if last_guess:
-                embed.description = f"Guessed `{last_guess}`\n{board_display}\n\n{keypad}"
-                embed.set_author(
-                    name=f"{ctx.author.display_name}",
-                    icon_url=ctx.author.display_avatar.url
-                )
+        if last_guess:
+            embed.set_author(
+                name=f"{ctx.author.display_name}",
+                icon_url=ctx.author.display_avatar.url
+            )
 
         view = SoloView(self.bot, game, ctx.author)
         await ctx.send(embed=embed, view=view, ephemeral=True)
@@ -590,10 +657,11 @@ class GameCommands(commands.Cog):
     async def cancel_solo(self, ctx):
         if not ctx.interaction: return
         await ctx.defer(ephemeral=True)
-        if ctx.author.id not in self.bot.solo_games:
+        uid = ctx.author.id
+        if uid not in self.bot.solo_games:
             return await ctx.send("⚠️ No active solo game to cancel.", ephemeral=True)
 
-        game = self.bot.solo_games.pop(ctx.author.id)
+        game = self.bot.solo_games.pop(uid)
         await ctx.send(f"✅ Solo game cancelled. The word was **{game.secret.upper()}**.", ephemeral=True)
 
     @commands.hybrid_command(name="stop_game", description="Force stop the current game.")
@@ -602,36 +670,27 @@ class GameCommands(commands.Cog):
         if not ctx.interaction: return
         await ctx.defer()
         cid = ctx.channel.id
-        game = self.bot.games.get(cid)
-        custom_game = self.bot.custom_games.get(cid)
-        rush_game = self.bot.constraint_mode.get(cid)
-
-        if not game and not custom_game and not rush_game:
-            return await ctx.send("No active game to stop.")
-
+        author = ctx.author
+        # Probe each game map only until one matches; pop once the stop is authorized
         # Handle regular game
+        game = self.bot.games.get(cid)
         if game:
-            if (ctx.author.id == game.started_by.id) or ctx.author.guild_permissions.manage_messages:
+            if (author.id == game.started_by.id) or author.guild_permissions.manage_messages:
                 self.bot.stopped_games.add(cid)
-                self.bot.games.pop(cid)
+                self.bot.games.pop(cid, None)
                 await ctx.send(f"🛑 Game stopped. Word: **{game.secret.upper()}**.")
 
-                async def _clear_stopped(ch_id):
-                    await asyncio.sleep(300)
-                    try:
-                        self.bot.stopped_games.discard(ch_id)
-                    except (KeyError, AttributeError):
-                        pass
-
-                self.bot.spawn_task(_clear_stopped(cid))
+                self._schedule_stopped_clear(cid)
             else:
                 await ctx.send("❌ Only Starter or Admin can stop it.", ephemeral=True)
             return
 
         # Handle custom game
+        custom_game = self.bot.custom_games.get(cid)
         if custom_game:
-            if (ctx.author.id == custom_game.started_by.id) or ctx.author.guild_permissions.manage_messages:
-                self.bot.custom_games.pop(cid)
+            if (author.id == custom_game.started_by.id) or author.guild_permissions.manage_messages:
+                self.bot.custom_games.pop(cid, None)
+                self.cancel_custom_timer(cid)
                 if getattr(custom_game, 'reveal_on_loss', True):
                     await ctx.send(f"🛑 Custom game stopped. Word: **{custom_game.secret.upper()}**.")
                 else:
@@ -641,12 +700,12 @@ class GameCommands(commands.Cog):
             return
 
         # Handle Word Rush session
-        if rush_game:
+        if cid in self.bot.constraint_mode:
             rush_cog = self.bot.get_cog("ConstraintMode")
             if not rush_cog:
                 return await ctx.send("⚠️ Word Rush controller is unavailable.", ephemeral=True)
 
-            ok, payload = await rush_cog.stop_rush_session(ctx.channel, requester=ctx.author)
+            ok, payload = await rush_cog.stop_rush_session(ctx.channel, requester=author)
             if not ok:
                 return await ctx.send(payload, ephemeral=True)
 
@@ -656,6 +715,8 @@ class GameCommands(commands.Cog):
                 await ctx.send(payload)
             return
 
+        await ctx.send("No active game to stop.")
+
     @commands.hybrid_command(name="custom", description="Start a custom Wordle game with your own word.")
     @commands.guild_only()
     async def custom_mode(self, ctx):
@@ -664,35 +725,11 @@ class GameCommands(commands.Cog):
         if not ctx.guild:
             return await ctx.send("❌ Command must be used in a server.", ephemeral=True)
 
-        cid = ctx.channel.id
-
-        # Check if a custom game already exists
-        if cid in self.bot.custom_games:
-            return await ctx.send("⚠️ A custom game is already active in this channel! Use `/stop_game` to end it.", ephemeral=True)
-
-        # Check if a regular game already exists
-        if cid in self.bot.games:
-            return await ctx.send("⚠️ A regular game is already active. Use `/stop_game` first.", ephemeral=True)
-        if cid in self.bot.constraint_mode:
-            return await ctx.send("⚠️ A Word Rush session is already active here. Finish it first.", ephemeral=True)
-        if cid in self.bot.race_sessions:
-            return await ctx.send("⚠️ A race session is already active here. Finish it first.", ephemeral=True)
-
-        embed = discord.Embed(
-            title="🧂 CUSTOM MODE",
-            color=discord.Color.teal()
-        )
-        embed.description = "Set up a game in **this** chat with your own custom word"
-        embed.add_field(
-            name="How it works?",
-            value="• Click **Set Up** button below and enter a 5-letter word\n"
-                  "• A wordle match would start, others can use `/guess` or `/g` to make a guess\n"
-                  "• This mode gives **no XP** or **WR** score\n\n"
-                  "*Tip: Use `/help custom` to see all extra options!*",
-            inline=False
-        )
-        embed.set_footer(text="You'll be prompted to enter a word and choose if the answer reveals on loss")
+        busy = _channel_busy_message(self.bot, ctx.channel.id)
+        if busy:
+            return await ctx.send(busy, ephemeral=True)
 
+        embed = self._custom_embed.copy()
         view = CustomSetupView(self.bot, ctx.author)
         await ctx.send(embed=embed, view=view, ephemeral=True)
 
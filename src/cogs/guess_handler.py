@@ -17,6 +17,7 @@ from src.utils import (
     roll_easter_egg,
     format_egg_message,
     format_attempt_footer,
+    format_progress_bar,
 )
 from src.ui import get_markdown_keypad_status
 from src.handlers.game_logic import handle_game_win, handle_game_loss, PlayAgainView
@@ -55,6 +56,13 @@ class GuessHandler(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
 
+    def _end_custom_game(self, cid):
+        """Drop a finished custom game and stop its time-limit timer."""
+        self.bot.custom_games.pop(cid, None)
+        game_cog = self.bot.get_cog("GameCommands")
+        if game_cog:
+            game_cog.cancel_custom_timer(cid)
+
     def _build_game_embed(self, title: str | None, color, board: str, keypad: str, footer: str,
                           header_text: str = "", show_keyboard: bool = True) -> discord.Embed:
         """
@@ -143,12 +151,18 @@ class GuessHandler(commands.Cog):
                 valid_check = game.custom_dict or set()
                 if game.secret.lower() not in valid_check:
                     valid_check.add(game.secret.lower())
-            elif is_custom and game.custom_dict:
-                valid_check = self.bot.all_valid_5 | game.custom_dict
+                is_valid = g_word in valid_check
+            elif is_custom:
+                # Custom words stay scoped to their game instead of joining the shared dictionary
+                is_valid = (
+                    g_word in self.bot.all_valid_5
+                    or g_word == game.secret.lower()
+                    or bool(game.custom_dict and g_word in game.custom_dict)
+                )
             else:
-                valid_check = self.bot.all_valid_5
+                is_valid = g_word in self.bot.all_valid_5
             
-            if g_word not in valid_check:
+            if not is_valid:
                 return await ctx.send(f"⚠️ **{g_word.upper()}** not in dictionary.", ephemeral=True)
 
             # Hard Mode Validation
@@ -186,9 +200,7 @@ class GuessHandler(commands.Cog):
             keypad = get_markdown_keypad_status(game.used_letters, self.bot, ctx.author.id, blind_mode=key_blind)
             
             # Progress bar
-            filled = "●" * game.attempts_used
-            empty = "○" * (game.max_attempts - game.attempts_used)
-            progress = f"[{filled}{empty}]"
+            progress_bar = format_progress_bar(game.attempts_used, game.max_attempts)
             
             # Board display
             if is_custom and game.blind_mode and not (win or game_over):
@@ -210,7 +222,7 @@ class GuessHandler(commands.Cog):
                     lines.append(masked)
                 board_display = "\n".join([f"{line}" for line in lines])
             else:
-                board_display = "\n".join([f"{h['pattern']}" for h in game.history])
+                board_display = game.board_string()
 
             # Fetch player badge (use cached profile - avoids DB hit on every guess)
             active_badge = None
@@ -229,32 +241,32 @@ class GuessHandler(commands.Cog):
             if is_custom:
                 # ========= CUSTOM GAME =========
                 if win:
-                    board_display = "\n".join([f"{h['pattern']}" for h in game.history])
+                    board_display = game.board_string()
                     embed = self._build_game_embed(
                         title="🏆 VICTORY!",
                         color=discord.Color.green(),
                         board=board_display,
                         keypad=keypad,
-                        footer=f"Attempts: {filled}{empty} | Custom mode (no rewards)",
+                        footer=f"Attempts: {progress_bar} | Custom mode (no rewards)",
                         header_text=f"**{ctx.author.display_name}** found **{game.secret.upper()}** in {game.attempts_used}/{game.max_attempts}!",
                         show_keyboard=show_kb
                     )
-                    self.bot.custom_games.pop(cid, None)
+                    self._end_custom_game(cid)
                     await ctx.send(embed=embed)
 
                 elif game_over:
-                    board_display = "\n".join([f"{h['pattern']}" for h in game.history])
+                    board_display = game.board_string()
                     reveal_text = f"The word was **{game.secret.upper()}**." if game.reveal_on_loss else "Better luck next time!"
                     embed = self._build_game_embed(
                         title="💀 GAME OVER",
                         color=discord.Color.red(),
                         board=board_display,
                         keypad=keypad,
-                        footer=f"Attempts: {filled}{empty} | Custom mode (no rewards)",
+                        footer=f"Attempts: {progress_bar} | Custom mode (no rewards)",
                         header_text=reveal_text,
                         show_keyboard=show_kb
                     )
-                    self.bot.custom_games.pop(cid, None)
+                    self._end_custom_game(cid)
                     await ctx.send(embed=embed)
 
                 else:
@@ -295,7 +307,7 @@ class GuessHandler(commands.Cog):
                 final_time = (datetime.datetime.now() - game.start_time).total_seconds()
                 from src.utils import get_win_flavor
                 flavor = get_win_flavor(game.attempts_used)
-                board_display = "\n".join([f"{h['pattern']}" for h in game.history])
+                board_display = game.board_string()
                 
                 instant_embed = self._build_game_embed(
                     title=f"🏆 VICTORY!\n{flavor}",
@@ -337,7 +349,7 @@ class GuessHandler(commands.Cog):
                 self.bot.games.pop(cid, None)
 
                 # 2. Build and send INSTANT board embed
-                board_display = "\n".join([f"{h['pattern']}" for h in game.history])
+                board_display = game.board_string()
                 instant_embed = self._build_game_embed(
                     title="💀 GAME OVER",
                     color=discord.Color.red(),
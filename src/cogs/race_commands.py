@@ -6,7 +6,7 @@ from discord.ext import commands, tasks
 from discord import app_commands
 import datetime
 import time
-from src.utils import format_attempt_footer
+from src.utils import format_attempt_footer, format_progress_bar
 import asyncio
 from src.race_game import RaceSession
 from src.ui_race import RaceLobbyView, RaceGameView
@@ -167,7 +167,7 @@ class RaceCommands(commands.Cog):
         
         # Recreate the game display
         game = user_race_game
-        board_display = "\n".join([f"{h['pattern']}" for h in game.history]) if game.history else "No guesses yet."
+        board_display = game.board_string() or "No guesses yet."
         
         # Generate keypad
         from src.ui_race import RaceGameView
@@ -193,10 +193,7 @@ class RaceCommands(commands.Cog):
             f"{guess_line}{board_display}\n\n"
             f"{keypad}"
         )
-        used = max(0, min(game.attempts_used, game.max_attempts))
-        filled = "●" * used
-        empty = "○" * (game.max_attempts - used)
-        bar = f"[{filled}{empty}]"
+        bar = format_progress_bar(game.attempts_used, game.max_attempts)
         time_text = f"<t:{end_ts}:R>" if end_ts else "N/A"
         footer = f"{bar} • Players: {user_race_session.participant_count} • Time: {time_text}"
         embed.set_footer(text=footer)
@@ -472,6 +472,69 @@ def update_user_stats_manual(bot: commands.Bot, user_id: int, xp_gain: int, wr_d
         print(f"❌ DB Error [update_user_stats_manual] user_id={user_id}: {e}")
         return None
 
+def update_user_stats_bulk(bot: commands.Bot, rows: list, mode: str = 'MULTI'):
+    """
+    Batched update_user_stats_manual: rows is a list of (user_id, xp_gain, wr_delta).
+    One select for all users, one insert for new users and one update per existing user.
+    Existing users get update() rather than a partial-row upsert: Postgres checks an upsert's
+    proposed insert row against NOT NULL columns before resolving the conflict.
+    Returns the rows that were NOT written; callers retry only those, never rows already credited.
+    """
+    if not rows: return []
+
+    wr_col = 'multi_wr' if mode == 'MULTI' else 'solo_wr'
+    try:
+        user_ids = [uid for uid, _, _ in rows]
+        response = bot.supabase_client.table('user_stats_v2').select('user_id, xp, multi_wr, solo_wr').in_('user_id', user_ids).execute()
+        existing = {r['user_id']: r for r in response.data}
+    except Exception as e:
+        print(f"❌ DB Error [update_user_stats_bulk] select users={len(rows)}: {e}")
+        return list(rows)
+
+    updates = []
+    inserts, insert_rows = [], []
+    for entry in rows:
+        uid, xp_gain, wr_delta = entry
+        row = existing.get(uid)
+        if row is None:
+            inserts.append({
+                'user_id': uid,
+                'xp': xp_gain,
+                'multi_wr': wr_delta if mode == 'MULTI' else 0,
+                'solo_wr': wr_delta if mode == 'SOLO' else 0,
+                'games_played': 0,
+                'games_won': 0,
+                'win_rate': 0.0,
+                'average_guesses': 0.0,
+                'streak_protection': 0
+            })
+            insert_rows.append(entry)
+        else:
+            updates.append((entry, {
+                'xp': (row.get('xp') or 0) + xp_gain,
+                wr_col: (row.get(wr_col) or 0) + wr_delta
+            }))
+
+    unwritten = []
+    if inserts:
+        try:
+            bot.supabase_client.table('user_stats_v2').insert(inserts).execute()
+        except Exception as e:
+            # e.g. another game created one of these users meanwhile; the per-row path re-reads them
+            print(f"❌ DB Error [update_user_stats_bulk] insert users={len(inserts)}: {e}")
+            unwritten.extend(insert_rows)
+    for entry, payload in updates:
+        try:
+            bot.supabase_client.table('user_stats_v2').update(payload).eq('user_id', entry[0]).execute()
+        except Exception as e:
+            print(f"❌ DB Error [update_user_stats_bulk] update user={entry[0]}: {e}")
+            unwritten.append(entry)
+
+    for uid in user_ids:
+        _PROFILE_CACHE.pop(uid, None)
+
+    return unwritten
+
 def fetch_user_profiles_batched(bot: commands.Bot, user_ids: list):
     """
     Industry-grade optimization: Fetch multiple profiles in ONE API call.
@@ -647,3 +710,25 @@ def log_event_v1(bot: commands.Bot, event_type: str, user_id: int = None, guild_
         # Silently fail or log to console - we don't want tracking to crash the game
         print(f"⚠️ Event Tracking Error ({event_type}): {e}")
         return False
+
+def log_events_bulk(bot: commands.Bot, events: list):
+    """
+    Batched log_event_v1: inserts all event dicts (event_type, user_id, guild_id, metadata)
+    into 'event_logs_v1' with a single request.
+    """
+    if not events: return True
+
+    try:
+        created_at = datetime.datetime.utcnow().isoformat()
+        rows = [{
+            'event_type': e['event_type'],
+            'user_id': e.get('user_id'),
+            'guild_id': e.get('guild_id'),
+            'metadata': e.get('metadata') or {},
+            'created_at': created_at
+        } for e in events]
+        bot.supabase_client.table('event_logs_v1').insert(rows).execute()
+        return True
+    except Exception as e:
+        print(f"⚠️ Event Tracking Error (bulk x{len(events)}): {e}")
+        return False
@@ -8,7 +8,8 @@ class WordleGame:
                  'used_letters', 'participants', 'guessed_words', 'last_interaction', 'message_id', 'start_time',
                  'reveal_on_loss', 'difficulty', 'custom_dict', 'time_limit', 'allowed_players', 'show_keyboard',
                  'blind_mode', 'custom_only', 'discovered_green_positions', 'title', 'monotonic_end_time',
-                 'hard_mode', 'hard_constraints', 'player_lock_confirmed', 'ready_players', 'allowed_player_names')
+                 'hard_mode', 'hard_constraints', 'player_lock_confirmed', 'ready_players', 'allowed_player_names',
+                 '_board_cache', '_keypad_cache')
 
     def __init__(self, secret: str, channel_id: int, started_by: discord.abc.User, message_id: int):
         self.secret = secret
@@ -21,8 +22,7 @@ class WordleGame:
         self.guessed_words = set()
         self.monotonic_end_time = None
         self.used_letters = {'correct': set(), 'present': set(), 'absent': set()}
-        self.last_interaction = datetime.datetime.now()
-        self.start_time = datetime.datetime.now()
+        self.start_time = self.last_interaction = datetime.datetime.now()
         self.message_id = message_id
         self.reveal_on_loss = True  # Default for custom games
         self.difficulty = 0         # 0=Simple, 1=Classic, 2=Custom
@@ -42,10 +42,20 @@ class WordleGame:
         # Hard Mode
         self.hard_mode = False
         self.hard_constraints = {'greens': [None]*5, 'present': set()}
+        self._board_cache = (0, "")  # (len(history), joined patterns)
+        self._keypad_cache = None  # (len(history), blind_mode, rendered keypad)
 
     @property
     def attempts_used(self): return len(self.history)
 
+    def board_string(self) -> str:
+        """Newline-joined guess patterns. History is append-only, so its length versions the cache."""
+        n, board = self._board_cache
+        if n != len(self.history):
+            board = "\n".join(h['pattern'] for h in self.history)
+            self._board_cache = (len(self.history), board)
+        return board
+
     def is_duplicate(self, word: str) -> bool: return word.upper() in self.guessed_words
 
     def evaluate_guess(self, guess: str) -> str: 
@@ -10,6 +10,31 @@ from src.utils import get_badge_emoji, get_win_flavor, get_cached_username
 from src.guess_entry import GuessEntryView
 
 
+def build_start_embed(title, color, desc, footer="Everyone in this channel can participate."):
+    """Builds a game start announcement with the shared "How to Play" field."""
+    embed = discord.Embed(title=title, color=color, description=desc)
+    embed.add_field(name="How to Play", value="`/guess word:xxxxx` or `/g word:xxxxx`", inline=False)
+    if footer:
+        embed.set_footer(text=footer)
+    return embed
+
+# Start announcements never vary per game; built once and copied per start
+_START_EMBEDS = {
+    'hard': build_start_embed(
+        "🛡️ Wordle Started! (HARD MODE)", discord.Color.red(),
+        "**OFFICIAL HARD RULES:**\n1. Greens must be fixed.\n2. Yellows must be reused.\n6 attempts.\n\n*Tip: Use `/help wordle` for detailed rules!*"
+    ),
+    'classic': build_start_embed(
+        "⚔️ Wordle Started! (Classic)", discord.Color.dark_gold(),
+        "**Hard Mode!** 6 attempts.\n\n*Tip: Use `/help wordle` for detailed rules!*"
+    ),
+    'simple': build_start_embed(
+        "✨ Wordle Started! (Simple)", discord.Color.blue(),
+        "A simple **5-letter word** has been chosen. **6 attempts** total.\n\n*Tip: Use `/help wordle` for detailed rules!*"
+    ),
+}
+
+
 async def _batch_fetch_participant_stats(bot, participant_ids: list):
     """Fetch WR, XP, Badges, and Daily Gains for multiple users in bulk."""
     stats_map = {} # {uid: {'wr': 1200, 'xp': 0, 'badge': '...', 'daily': 0}}
@@ -130,7 +155,7 @@ async def _process_game_results(bot, game, winner_user, guild_id, time_taken, in
         win_badge_str = f" {get_badge_emoji(win_badge)}" if win_badge else ""
         
         if include_board:
-            board_display = "\n".join([f"{h['pattern']}" for h in game.history])
+            board_display = game.board_string()
             embed.description = f"**{winner_user.mention}{win_badge_str}** found **{game.secret.upper()}** in {game.attempts_used}/6!"
             embed.add_field(name="\u200b", value=board_display, inline=False)
             embed.set_footer(text=f"⏱️ Solved in {time_taken:.1f}s")
@@ -142,7 +167,7 @@ async def _process_game_results(bot, game, winner_user, guild_id, time_taken, in
         embed = discord.Embed(title="💀 GAME OVER", color=discord.Color.red())
         embed.description = f"The word was **{game.secret.upper()}**."
         if include_board:
-            board_display = "\n".join([f"{h['pattern']}" for h in game.history])
+            board_display = game.board_string()
             embed.add_field(name="\u200b", value=board_display, inline=False)
 
     # 3. Simulate & Record Winners
@@ -243,6 +268,14 @@ async def start_multiplayer_game(bot, interaction_or_ctx, is_classic: bool, hard
     Shared logic to start a multiplayer game (Simple or Classic).
     Used by commands and 'Play Again' buttons.
     """
+    # Serialize check-and-register per channel: the existence checks and the
+    # bot.games insert are separated by defer/send awaits
+    lock = bot.start_lock(interaction_or_ctx.channel.id)
+    async with lock:
+        return await _start_multiplayer_game(bot, interaction_or_ctx, is_classic, hard_mode)
+
+
+async def _start_multiplayer_game(bot, interaction_or_ctx, is_classic: bool, hard_mode: bool):
     # 1. Identity & Context
     is_interaction = isinstance(interaction_or_ctx, discord.Interaction)
     guild = interaction_or_ctx.guild if is_interaction else interaction_or_ctx.guild
@@ -312,15 +345,7 @@ async def start_multiplayer_game(bot, interaction_or_ctx, is_classic: bool, hard
 
         # LOADING STATE
         secret = "LOADING"
-        
-        if hard_mode:
-            title = "🛡️ Wordle Started! (HARD MODE)"
-            color = discord.Color.red()
-            desc = "**OFFICIAL HARD RULES:**\n1. Greens must be fixed.\n2. Yellows must be reused.\n6 attempts.\n\n*Tip: Use `/help wordle` for detailed rules!*"
-        else:
-            title = "⚔️ Wordle Started! (Classic)"
-            color = discord.Color.dark_gold()
-            desc = "**Hard Mode!** 6 attempts.\n\n*Tip: Use `/help wordle` for detailed rules!*"
+        embed_key = 'hard' if hard_mode else 'classic'
     else:
         if not bot.secrets:
             msg = "❌ Simple word list missing."
@@ -334,14 +359,10 @@ async def start_multiplayer_game(bot, interaction_or_ctx, is_classic: bool, hard
 
         # LOADING STATE
         secret = "LOADING"
-        title = "✨ Wordle Started! (Simple)"
-        color = discord.Color.blue()
-        desc = "A simple **5-letter word** has been chosen. **6 attempts** total.\n\n*Tip: Use `/help wordle` for detailed rules!*"
+        embed_key = 'simple'
 
     # 4. Announcement
-    embed = discord.Embed(title=title, color=color, description=desc)
-    embed.add_field(name="How to Play", value="`/guess word:xxxxx` or `/g word:xxxxx`", inline=False)
-    embed.set_footer(text="Everyone in this channel can participate.")
+    embed = _START_EMBEDS[embed_key].copy()
     
     if is_interaction:
         if not interaction_or_ctx.response.is_done():
@@ -1,5 +1,6 @@
 import random
 import re
+from operator import methodcaller
 
 class ConstraintGenerator:
     def __init__(self, secrets_dict, full_dict, valid_dict):
@@ -18,6 +19,9 @@ class ConstraintGenerator:
         # For simplicity, we stick to secrets for 'five' and full for 'all'
         
         # Precompute for optimization
+        # Indexable snapshots so random picks don't materialize list(set) per call
+        self._secrets_seq = tuple(secrets_dict)
+        self._combined_seq = tuple(self.combined_dict)
         self.vowels = frozenset('aeiou')
         self.consonants = frozenset('bcdfghjklmnpqrstvwxyz')
         
@@ -55,10 +59,12 @@ class ConstraintGenerator:
                     self.words_containing_letter[char].add(word)
         
         # Precompute VCV words for all words
-        self._vcv_words_all = set()
-        for word in self.combined_dict:
-            if self._has_vcv_pattern(word):
-                self._vcv_words_all.add(word)
+        self._vcv_words_all = frozenset(w for w in self.combined_dict if self._has_vcv_pattern(w))
+
+        # Indices are read-only after the build; frozen so puzzles can hand them out as solution sets
+        for index in (self.words_by_first_letter, self.words_by_last_letter, self.words_containing_letter):
+            for l, words in index.items():
+                index[l] = frozenset(words)
 
     def _has_vcv_pattern(self, word):
         """Optimized VCV pattern check."""
@@ -159,25 +165,26 @@ class ConstraintGenerator:
                 
                 return {
                     'description': f"**Type the LONGEST word starting with {letter.upper()}**\n(Winner takes all!)",
-                    'validator': lambda w: w[0].lower() == letter,
-                    'solutions': self.words_by_first_letter.get(letter, set()), # Still needed for multi-word scoring
+                    'validator': methodcaller('startswith', letter),
+                    'solutions': self.words_by_first_letter.get(letter, frozenset()), # Still needed for multi-word scoring
                     'visual': None,
                     'type': 'longest_word',
                     'five_letter_only': False,
                     'multi_word': True
                 }
             else:  # most_words
-                base_word = random.choice(list(self.secrets_dict))
+                base_word = random.choice(self._secrets_seq)
                 letters = random.sample(list(set(base_word)), 3)
+                letters_set = frozenset(letters)
                 
                 # Optimized solutions using set intersections
                 solutions = self.combined_dict
                 for l in letters:
-                    solutions = solutions & self.words_containing_letter.get(l, set())
+                    solutions = solutions & self.words_containing_letter.get(l, frozenset())
                 
                 return {
                     'description': f"**Type as many words as you can containing {', '.join(l.upper() for l in letters)}**\n(Most words wins!)",
-                    'validator': lambda w: all(l in w for l in letters),
+                    'validator': letters_set.issubset,
                     'solutions': solutions,
                     'visual': None,
                     'type': 'most_words',
@@ -187,7 +194,7 @@ class ConstraintGenerator:
         else:
             return {
                 'description': "**🎁 BONUS: Find a word with vowel-consonant-vowel pattern (VCV)**\n*Using the full dictionary!*",
-                'validator': lambda w: w in self._vcv_words_all,
+                'validator': self._vcv_words_all.__contains__,
                 'visual': None,
                 'type': 'vcv_bonus',
                 'five_letter_only': False,
@@ -214,7 +221,7 @@ class ConstraintGenerator:
 
     def _type_substring(self):
         """3-letter substring - 5-letter words only."""
-        word = random.choice(list(self.secrets_dict))
+        word = random.choice(self._secrets_seq)
         start = random.randint(0, 2)
         sub = word[start:start+3]
         desc = f"Word containing **{sub.upper()}** together\n*(5-letter words only)*"
@@ -222,26 +229,26 @@ class ConstraintGenerator:
 
     def _type_substring_plus_letter(self):
         """2-letter substring + another letter - all words."""
-        word = random.choice(list(self.secrets_dict))
+        word = random.choice(self._secrets_seq)
         sub = word[0:2]
-        other_word = random.choice(list(self.combined_dict))
+        other_word = random.choice(self._combined_seq)
         other_letter = random.choice([c for c in other_word if c not in sub])
         desc = f"Word containing **{sub.upper()}** with **{other_letter.upper()}** anywhere\n*(5 or MORE letter words)*"
         return desc, lambda w: sub in w and other_letter in w, None, 'all', f"{sub}+{other_letter}"
 
     def _type_letters_anywhere(self):
         """3 letters anywhere - all words."""
-        word = random.choice(list(self.secrets_dict))
+        word = random.choice(self._secrets_seq)
         letters = random.sample(list(set(word)), min(3, len(set(word))))
         desc = f"Word containing **{', '.join(l.upper() for l in letters)}** (anywhere)\n*(5 or MORE letter words)*"
         
         # Optimized validator using set operations
         letters_set = frozenset(letters)
-        return desc, lambda w: letters_set.issubset(w), None, 'all', "".join(sorted(letters))
+        return desc, letters_set.issubset, None, 'all', "".join(sorted(letters))
 
     def _type_include_exclude(self):
         """Include certain letters, exclude others - all words."""
-        word = random.choice(list(self.secrets_dict))
+        word = random.choice(self._secrets_seq)
         include = random.sample(list(set(word)), min(2, len(set(word))))
         pool = [c for c in 'aeiorsnt' if c not in word]
         exclude = random.sample(pool, min(2, len(pool))) if len(pool) >= 2 else ['z', 'q']
@@ -277,7 +284,7 @@ class ConstraintGenerator:
             self._type_double_letter()  # Build cache
         
         double = random.choice(list(self._double_letter_cache.keys()))
-        other_word = random.choice(list(self.combined_dict))
+        other_word = random.choice(self._combined_seq)
         other_letter = random.choice([c for c in other_word if c not in double])
         
         desc = f"Word with double **{double[0].upper()}** and **{other_letter.upper()}** anywhere\n*(5 or MORE letter words)*"
@@ -292,9 +299,9 @@ class ConstraintGenerator:
 
     def _type_start_end_same(self):
         """Starts and ends with same letter + another letter - all words."""
-        word = random.choice(list(self.secrets_dict))
+        word = random.choice(self._secrets_seq)
         letter = word[0]
-        other_word = random.choice(list(self.combined_dict))
+        other_word = random.choice(self._combined_seq)
         other_letter = random.choice([c for c in other_word if c != letter])
         
         desc = f"Word starting and ending with **{letter.upper()}**, with **{other_letter.upper()}**\n*(5 or MORE letter words)*"
@@ -302,7 +309,7 @@ class ConstraintGenerator:
 
     def _type_wordle_block(self):
         """Wordle-style pattern - 5-letter words only."""
-        word = random.choice(list(self.secrets_dict))
+        word = random.choice(self._secrets_seq)
         positions = random.sample(range(5), 2)
         pattern = ['-'] * 5
         
@@ -314,12 +321,7 @@ class ConstraintGenerator:
         
         desc = f"Word matching pattern\n*(5-letter words only)*"
         
-        def validator(w):
-            if len(w) != 5:
-                return False
-            for i in range(5):
-                if pattern[i] != '-' and w[i] != pattern[i]:
-                    return False
-            return True
+        # Fixed length + fixed positions compile to one C-level match ('-' -> any letter)
+        validator = re.compile(visual.replace('-', '[a-z]')).fullmatch
             
         return desc, validator, visual, 'five', visual
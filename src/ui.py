@@ -38,6 +38,19 @@ def get_markdown_keypad_status(used_letters: dict, bot=None, user_id: int=None,
         
     return keypad_display + "\n" + extra_line
 
+def get_game_keypad_status(game, bot=None, user_id: int=None, blind_mode=False) -> str:
+    """
+    get_markdown_keypad_status for a WordleGame, cached on the game.
+    used_letters only changes when a guess lands in history, so len(history) versions it.
+    """
+    version = len(game.history)
+    cached = game._keypad_cache
+    if cached is not None and cached[0] == version and cached[1] == blind_mode:
+        return cached[2]
+    keypad = get_markdown_keypad_status(game.used_letters, bot, user_id, blind_mode=blind_mode)
+    game._keypad_cache = (version, blind_mode, keypad)
+    return keypad
+
 # --- SOLO MODE UI ---
 
 class SoloGuessModal(ui.Modal, title="Enter your Guess"):
@@ -66,11 +79,6 @@ class SoloGuessModal(ui.Modal, title="Enter your Guess"):
                 
             # Process Turn
             pat, win, game_over = self.game.process_turn(guess, interaction.user)
-            
-             # Progress Bar Logic
-            filled = "●" * self.game.attempts_used
-            empty = "○" * (self.game.max_attempts - self.game.attempts_used)
-            progress_bar = f"[{filled}{empty}]"
 
             # Board Display
             board_display = "\n".join([f" {h['pattern']}" for h in self.game.history])
@@ -80,7 +88,7 @@ class SoloGuessModal(ui.Modal, title="Enter your Guess"):
                 import asyncio
                 from src.database import record_game_v2, simulate_record_game, fetch_user_profile_v2, get_daily_wr_gain
                 
-                keypad = get_markdown_keypad_status(self.game.used_letters, self.bot, interaction.user.id, blind_mode=False)
+                keypad = get_game_keypad_status(self.game, self.bot, interaction.user.id, blind_mode=False)
                 time_taken = (datetime.datetime.now() - self.game.start_time).total_seconds()
                 flavor = get_win_flavor(self.game.attempts_used)
                 embed = discord.Embed(title=f"🏆 VICTORY! {flavor}", color=discord.Color.green())
@@ -120,7 +128,7 @@ class SoloGuessModal(ui.Modal, title="Enter your Guess"):
                 await interaction.response.edit_message(content="", embed=embed, view=self.view_ref)
 
             elif game_over:
-                keypad = get_markdown_keypad_status(self.game.used_letters, self.bot, interaction.user.id, blind_mode=False)
+                keypad = get_game_keypad_status(self.game, self.bot, interaction.user.id, blind_mode=False)
                 embed = discord.Embed(title="💀 GAME OVER", color=discord.Color.red())
                 embed.description = f"The word was **{self.game.secret.upper()}**.\n\n**Final Board:**\n{board_display}\n\n**Keyboard:**\n{keypad}"
                 
@@ -131,7 +139,7 @@ class SoloGuessModal(ui.Modal, title="Enter your Guess"):
 
             else:
                 # Ongoing game - board + keyboard in embed description
-                keypad = get_markdown_keypad_status(self.game.used_letters, self.bot, interaction.user.id, blind_mode=self.game.blind_mode)
+                keypad = get_game_keypad_status(self.game, self.bot, interaction.user.id, blind_mode=self.game.blind_mode)
                 embed = discord.Embed(color=discord.Color.gold())
                 embed.description = f"Guessed `{guess.upper()}`\n{board_display}\n\n{keypad}"
                 embed.set_footer(text=format_attempt_footer(self.game.attempts_used, self.game.max_attempts))
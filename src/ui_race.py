@@ -4,7 +4,7 @@ import datetime
 import time
 import asyncio
 from src.config import KEYBOARD_LAYOUT
-from src.utils import EMOJIS
+from src.utils import EMOJIS, format_progress_bar
 
 
 class RaceLobbyView(ui.View):
@@ -138,9 +138,7 @@ class RaceLobbyView(ui.View):
         # Create View and Embed
         view = RaceGameView(self.bot, game, interaction.user, self.race_session)
         
-        filled = "●" * game.attempts_used
-        empty = "○" * (game.max_attempts - game.attempts_used)
-        progress_bar = f"[{filled}{empty}]"
+        progress_bar = format_progress_bar(game.attempts_used, game.max_attempts)
         
         end_ts = int(self.race_session.end_time.timestamp()) if self.race_session.end_time else 0
         
@@ -154,7 +152,7 @@ class RaceLobbyView(ui.View):
             f"Click **Make Guess** to start!"
         )
         if game.history:
-             board_display = "\n".join([f"{h['pattern']}" for h in game.history])
+             board_display = game.board_string()
              embed.description += f"\n\n{board_display}"
              
              # Keypad
@@ -392,9 +390,7 @@ class RaceGuessModal(ui.Modal, title="🏁 Race Guess"):
         # Update the game display
         await interaction.response.defer()
         
-        filled = "●" * self.game.attempts_used
-        empty = "○" * (self.game.max_attempts - self.game.attempts_used)
-        progress_bar = f"[{filled}{empty}]"
+        progress_bar = format_progress_bar(self.game.attempts_used, self.game.max_attempts)
         
         board_display = "\n".join([f"# {h['pattern']}" for h in self.game.history])
         keypad = self.view_ref.get_markdown_keypad(self.game.used_letters, interaction.user.id)
@@ -2,8 +2,12 @@ import requests
 import random
 import asyncio
 import discord
+from cachetools import TTLCache
 from src.config import TOKEN, APP_ID, TIERS
 
+# fetch_user results, so users outside the gateway cache cost one API call per TTL
+_USERNAME_CACHE = TTLCache(maxsize=5000, ttl=7 * 86400)
+
 def load_app_emojis(bot_token=TOKEN, app_id=APP_ID):
     url = f"https://discord.com/api/v10/applications/{app_id}/emojis"
     headers = {"Authorization": f"Bot {bot_token}"}
@@ -145,11 +149,23 @@ def format_egg_message(egg: str, display_name: str, emojis: dict) -> str:
     egg_emoji = emojis.get(egg, "🎉")
     return f"{egg_emoji} {display_name} • {egg.title()} found • Added to collection"
 
-def format_attempt_footer(attempts_used: int, max_attempts: int) -> str:
+# Bars and footers for the standard 6-attempt board, indexed by attempts used
+_PROGRESS_BARS_6 = tuple(f"[{'●' * i}{'○' * (6 - i)}]" for i in range(7))
+_ATTEMPT_FOOTERS_6 = tuple(f"Attempt {i}/6 {bar}" for i, bar in enumerate(_PROGRESS_BARS_6))
+
+def format_progress_bar(attempts_used: int, max_attempts: int) -> str:
     used = max(0, min(attempts_used, max_attempts))
+    if max_attempts == 6:
+        return _PROGRESS_BARS_6[used]
     filled = "●" * used
     empty = "○" * (max_attempts - used)
-    return f"Attempt {used}/{max_attempts} [{filled}{empty}]"
+    return f"[{filled}{empty}]"
+
+def format_attempt_footer(attempts_used: int, max_attempts: int) -> str:
+    used = max(0, min(attempts_used, max_attempts))
+    if max_attempts == 6:
+        return _ATTEMPT_FOOTERS_6[used]
+    return f"Attempt {used}/{max_attempts} {format_progress_bar(used, max_attempts)}"
 
 def calculate_level(xp: int) -> int:
     """Calculates level from total XP. Legacy simple return."""
@@ -200,24 +216,30 @@ async def get_cached_username(bot, user_id: int, *, allow_cache_write: bool = Tr
     if user_id in bot.name_cache:
         return bot.name_cache[user_id]
     
-    # 2. Try bot's get_user (Instant local cache check)
+    # 2. Try bot's get_user (Instant local cache check, always the current name)
     user = bot.get_user(user_id)
     if user:
         if allow_cache_write:
             bot.name_cache[user_id] = user.display_name
         return user.display_name
+
+    # 3. Reuse a recent API result before fetching again
+    name = _USERNAME_CACHE.get(user_id)
+    if name is not None:
+        return name
     
-    # 3. Try to fetch from Discord API
+    # 4. Try to fetch from Discord API
     try:
         user = await bot.fetch_user(user_id)
         if user:
             bot.name_cache[user_id] = user.display_name
+            _USERNAME_CACHE[user_id] = user.display_name
             return user.display_name
     except (discord.NotFound, discord.Forbidden, discord.HTTPException) as e:
         # User not found or inaccessible; fall through to ID fallback
         pass
     
-    # 4. Fallback
+    # 5. Fallback
     return str(user_id)
 
 def is_user_banned(bot, user_id: int) -> bool:
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Tests for update_user_stats_bulk against a mocked Supabase client.
+Checks which statements each branch sends and which rows come back as unwritten.
+"""
+
+from unittest.mock import MagicMock
+
+from src.database import update_user_stats_bulk
+
+
+def make_bot(existing_rows, fail_insert=False, fail_update_for=()):
+    """Bot whose supabase_client records (op, payload, filter) for every statement."""
+    calls = []
+    client = MagicMock()
+
+    def table(name):
+        assert name == 'user_stats_v2'
+        t = MagicMock()
+
+        def select(cols):
+            q = MagicMock()
+            def in_(col, ids):
+                calls.append(('select', cols, (col, list(ids))))
+                res = MagicMock()
+                res.execute.return_value = MagicMock(data=[r for r in existing_rows if r['user_id'] in ids])
+                return res
+            q.in_.side_effect = in_
+            return q
+
+        def insert(payload):
+            calls.append(('insert', payload, None))
+            q = MagicMock()
+            if fail_insert:
+                q.execute.side_effect = Exception("duplicate key")
+            return q
+
+        def update(payload):
+            q = MagicMock()
+            def eq(col, value):
+                calls.append(('update', payload, (col, value)))
+                res = MagicMock()
+                if value in fail_update_for:
+                    res.execute.side_effect = Exception("timeout")
+                return res
+            q.eq.side_effect = eq
+            return q
+
+        t.select.side_effect = select
+        t.insert.side_effect = insert
+        t.update.side_effect = update
+        t.upsert.side_effect = AssertionError("partial-row upsert must not be used")
+        return t
+
+    client.table.side_effect = table
+    bot = MagicMock()
+    bot.supabase_client = client
+    return bot, calls
+
+
+def test_empty_rows_sends_nothing():
+    bot, calls = make_bot([])
+    assert update_user_stats_bulk(bot, []) == []
+    assert calls == []
+
+
+def test_existing_users_are_updated_by_id():
+    bot, calls = make_bot([
+        {'user_id': 1, 'xp': 100, 'multi_wr': 50, 'solo_wr': 7},
+        {'user_id': 2, 'xp': None, 'multi_wr': None, 'solo_wr': 0},
+    ])
+    unwritten = update_user_stats_bulk(bot, [(1, 10, 5), (2, 3, 1)], 'MULTI')
+
+    assert unwritten == []
+    assert [c[0] for c in calls] == ['select', 'update', 'update']
+    assert calls[1][1:] == ({'xp': 110, 'multi_wr': 55}, ('user_id', 1))
+    assert calls[2][1:] == ({'xp': 3, 'multi_wr': 1}, ('user_id', 2))
+
+
+def test_solo_mode_updates_solo_wr():
+    bot, calls = make_bot([{'user_id': 1, 'xp': 0, 'multi_wr': 9, 'solo_wr': 20}])
+    assert update_user_stats_bulk(bot, [(1, 4, 2)], 'SOLO') == []
+    assert calls[1][1] == {'xp': 4, 'solo_wr': 22}
+
+
+def test_new_users_get_one_full_insert():
+    bot, calls = make_bot([])
+    unwritten = update_user_stats_bulk(bot, [(7, 15, 3), (8, 5, 0)], 'MULTI')
+
+    assert unwritten == []
+    assert [c[0] for c in calls] == ['select', 'insert']
+    inserted = calls[1][1]
+    assert [r['user_id'] for r in inserted] == [7, 8]
+    assert inserted[0]['xp'] == 15 and inserted[0]['multi_wr'] == 3 and inserted[0]['solo_wr'] == 0
+    assert inserted[0]['games_played'] == 0 and inserted[0]['streak_protection'] == 0
+
+
+def test_select_failure_returns_every_row():
+    bot, calls = make_bot([])
+    bot.supabase_client.table.side_effect = Exception("connection reset")
+    rows = [(1, 10, 5), (2, 3, 1)]
+    assert update_user_stats_bulk(bot, rows) == rows
+
+
+def test_insert_failure_returns_only_new_users():
+    bot, calls = make_bot([{'user_id': 1, 'xp': 0, 'multi_wr': 0, 'solo_wr': 0}], fail_insert=True)
+    unwritten = update_user_stats_bulk(bot, [(1, 10, 5), (2, 3, 1)], 'MULTI')
+
+    assert unwritten == [(2, 3, 1)]
+    assert [c[0] for c in calls] == ['select', 'insert', 'update']
+
+
+def test_update_failure_returns_only_that_user():
+    bot, calls = make_bot([
+        {'user_id': 1, 'xp': 0, 'multi_wr': 0, 'solo_wr': 0},
+        {'user_id': 2, 'xp': 0, 'multi_wr': 0, 'solo_wr': 0},
+    ], fail_update_for=(1,))
+    unwritten = update_user_stats_bulk(bot, [(1, 10, 5), (2, 3, 1)], 'MULTI')
+
+    assert unwritten == [(1, 10, 5)]
+    assert [c[0] for c in calls] == ['select', 'update', 'update']
+
+
+if __name__ == "__main__":
+    for name, fn in list(globals().items()):
+        if name.startswith("test_") and callable(fn):
+            fn()
+            print(f"✅ {name}")